@@ -44,6 +44,12 @@ from datetime import datetime
 from loguru import logger
 import yaml
 
+# libyaml C parser when PyYAML was built with it (pure-Python fallback)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Import GairiHead components
 from src.voice_handler import VoiceHandler
 from src.llm_tier_manager import LLMTierManager
@@ -70,7 +76,7 @@ class GairiHeadAssistant:
 
         # Load config
         with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=YamlLoader)
 
         logger.info("=== GairiHead Voice Assistant v1.0 ===")
 
@@ -424,10 +430,10 @@ class GairiHeadAssistant:
                     except:
                         pass
 
-                # Send to Gary for full processing
-                result = self.voice.llm_manager.process_audio_query(audio, self.voice.sample_rate, authorization)
+                # Send to Gary for full processing - speech starts while the reply streams in
+                result, speaker = self.voice.stream_reply(audio, authorization)
 
-                if result and result.get('response'):
+                if result:
                     response_text = result['response']
 
                     # Get emotion for voice modulation from Gary's response
@@ -449,15 +455,16 @@ class GairiHeadAssistant:
                             pass
 
                     # Process stage actions from Gary's metadata (winks, LED patterns, pauses, sounds)
+                    # while the reply is spoken (they arrive with the final result)
                     if self.stage_actions and result.get('actions'):
                         try:
                             await self.stage_actions.process_actions_metadata(result['actions'])
                         except Exception as e:
                             logger.error(f"Failed to process stage actions: {e}")
 
-                    # Speak with emotion-based voice modulation (v2.1)
+                    # Wait for the emotion-modulated reply to finish (v2.1)
                     # NOTE: Don't set to 'speaking' - let emotion expression show during speech
-                    self.voice.speak(response_text, emotion=current_emotion)
+                    await asyncio.to_thread(speaker.join)
 
                     # Update display
                     if self.arduino_display and self.arduino_display.connected:
@@ -515,11 +522,9 @@ class GairiHeadAssistant:
                             except:
                                 pass
 
-                        follow_up_result = self.voice.llm_manager.process_audio_query(
-                            follow_up_audio, self.voice.sample_rate, authorization
-                        )
+                        follow_up_result, speaker = self.voice.stream_reply(follow_up_audio, authorization)
 
-                        if follow_up_result and follow_up_result.get('response'):
+                        if follow_up_result:
                             follow_up_response = follow_up_result['response']
 
                             # Get emotion from Gary's response (handle list or string)
@@ -539,9 +544,9 @@ class GairiHeadAssistant:
                                 except:
                                     pass
 
-                            # Speak follow-up response with emotion
+                            # Wait for the emotion-modulated follow-up reply to finish
                             # NOTE: Don't set to 'speaking' - let emotion expression show during speech
-                            self.voice.speak(follow_up_response, emotion=current_emotion)
+                            await asyncio.to_thread(speaker.join)
 
                             # Update display with follow-up
                             if self.arduino_display and self.arduino_display.connected:
@@ -588,6 +593,10 @@ class GairiHeadAssistant:
                 except Exception as e:
                     logger.debug(f"Servo close failed: {e}")
 
+            # Close sound effect stream to release the audio device for server access
+            if self.stage_actions:
+                self.stage_actions.close()
+
             # Close Arduino display to release serial port for server access
             if self.arduino_display and self.arduino_display.connected:
                 try:
@@ -950,6 +959,12 @@ class GairiHeadAssistant:
         if self.camera:
             self.camera.release()
 
+        if self.stage_actions:
+            self.stage_actions.close()
+
+        if self.voice:
+            self.voice.cleanup()
+
         if hasattr(self, 'servo_controller') and self.servo_controller:
             try:
                 self.servo_controller.cleanup()
@@ -0,0 +1,52 @@
+#!/bin/bash
+# Deploy the NeoPixel controller to the Pico (CircuitPython)
+#
+# If mpy-cross is installed, the controller is precompiled to bytecode and
+# installed as lib/neopixel_controller.mpy (no compile on the Pico at boot, less
+# RAM), with a small code.py that imports it. The source goes alongside as
+# lib/neopixel_controller_src.py - code.py falls back to it if the .mpy won't
+# load (e.g. mpy-cross from a different CircuitPython version).
+# Plain bytecode only: stock RP2040 CircuitPython builds don't load native
+# code from .mpy files (CIRCUITPY_ENABLE_MPY_NATIVE is off).
+# Without mpy-cross the plain source is copied to code.py.
+#
+# mpy-cross must match the CircuitPython firmware version on the Pico:
+#   https://adafruit-circuitpython.s3.amazonaws.com/index.html?prefix=bin/mpy-cross/
+
+set -e
+
+CIRCUITPY="${1:-/media/tim/CIRCUITPY}"
+
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
+PROJECT_DIR="$(dirname "$SCRIPT_DIR")"
+SOURCE="$PROJECT_DIR/src/pico/neopixel_controller.py"
+
+if [ ! -d "$CIRCUITPY" ]; then
+    echo "❌ CIRCUITPY drive not found at $CIRCUITPY"
+    echo "Usage: $0 [path-to-CIRCUITPY]"
+    exit 1
+fi
+
+if command -v mpy-cross > /dev/null 2>&1; then
+    echo "Compiling neopixel_controller.py (bytecode)..."
+    mkdir -p "$CIRCUITPY/lib"
+    mpy-cross -o "$CIRCUITPY/lib/neopixel_controller.mpy" "$SOURCE"
+    cp "$SOURCE" "$CIRCUITPY/lib/neopixel_controller_src.py"
+
+    cat > "$CIRCUITPY/code.py" <<'PY'
+try:
+    import neopixel_controller
+except (ImportError, ValueError):  # .mpy from an incompatible mpy-cross
+    import neopixel_controller_src as neopixel_controller
+neopixel_controller.main()
+PY
+    echo "✅ Deployed lib/neopixel_controller.mpy (+ source fallback) + code.py"
+else
+    echo "⚠️  mpy-cross not found - deploying pure-Python source"
+    rm -f "$CIRCUITPY/lib/neopixel_controller.mpy" "$CIRCUITPY/lib/neopixel_controller_src.py"
+    cp "$SOURCE" "$CIRCUITPY/code.py"
+    echo "✅ Deployed code.py"
+fi
+
+sync
+echo "Pico will auto-reload"
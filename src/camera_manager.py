@@ -17,6 +17,12 @@ import yaml
 from typing import Optional, Tuple
 import subprocess
 
+# libyaml C parser when PyYAML was built with it (pure-Python fallback)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 class CameraManager:
     """Manages camera access with USB/CSI compatibility"""
@@ -69,7 +75,7 @@ class CameraManager:
     def _load_config(self, config_path):
         """Load configuration file"""
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
 
     def _try_usb_camera(self) -> bool:
         """Try to open USB camera via OpenCV"""
@@ -20,6 +20,12 @@ from collections import deque
 from pathlib import Path
 from loguru import logger
 
+# libyaml C parser when PyYAML was built with it (pure-Python fallback)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 class ExpressionEngine:
     """Manages emotional state and coordinates hardware for expressions"""
 
@@ -90,12 +96,12 @@ class ExpressionEngine:
         # Main config
         config_file = self.config_path / 'gairi_head.yaml'
         with open(config_file, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=YamlLoader)
 
         # Expressions config
         expr_file = self.config_path / 'expressions.yaml'
         with open(expr_file, 'r') as f:
-            expr_config = yaml.safe_load(f)
+            expr_config = yaml.load(f, Loader=YamlLoader)
             self.expressions = expr_config['expressions']
             self.transition_speed = expr_config.get('transition_speed', 300) / 1000.0
 
@@ -174,27 +180,30 @@ class ExpressionEngine:
 
         # Servos
         if self.servo_controller:
+            left = right = mouth = None
+
             # Handle eyelids (nested structure in YAML)
             if 'eyelids' in expr:
-                if 'left' in expr['eyelids'] and 'right' in expr['eyelids']:
-                    logger.info(f"👁️ Applying eyelids for '{self.current_expression}': left={expr['eyelids']['left']}°, right={expr['eyelids']['right']}°")
-                if 'left' in expr['eyelids']:
-                    self.servo_controller.set_left_eyelid(expr['eyelids']['left'])
-                if 'right' in expr['eyelids']:
-                    self.servo_controller.set_right_eyelid(expr['eyelids']['right'])
+                left = expr['eyelids'].get('left')
+                right = expr['eyelids'].get('right')
+                if left is not None and right is not None:
+                    logger.info(f"👁️ Applying eyelids for '{self.current_expression}': left={left}°, right={right}°")
             # Fallback for direct left_eyelid/right_eyelid (old format)
             elif 'left_eyelid' in expr:
-                self.servo_controller.set_left_eyelid(expr['left_eyelid'])
-                self.servo_controller.set_right_eyelid(expr.get('right_eyelid', expr['left_eyelid']))
+                left = expr['left_eyelid']
+                right = expr.get('right_eyelid', left)
 
             # Handle mouth (nested structure in YAML)
             if 'mouth' in expr:
                 if isinstance(expr['mouth'], dict):
                     # New format: mouth has 'angle' key
-                    self.servo_controller.set_mouth(expr['mouth'].get('angle', 0))
+                    mouth = expr['mouth'].get('angle', 0)
                 else:
                     # Old format: mouth is direct number
-                    self.servo_controller.set_mouth(expr['mouth'])
+                    mouth = expr['mouth']
+
+            # Eyelids and mouth move together as one frame
+            self.servo_controller.set_frame(left, right, mouth, duration=0.25)
 
         # NeoPixels
         if self.neopixel_controller and 'eyes' in expr:
@@ -423,16 +432,13 @@ class ExpressionEngine:
         current_left = self.servo_controller.current_left
         current_right = self.servo_controller.current_right
 
-        # Droop
-        self.servo_controller.set_left_eyelid(max(0, current_left - 15),
-                                              smooth=True, duration=0.4)
-        self.servo_controller.set_right_eyelid(max(0, current_right - 15),
-                                               smooth=True, duration=0.4)
+        # Droop (both eyes together)
+        self.servo_controller.set_eyelids(max(0, current_left - 15), max(0, current_right - 15),
+                                          smooth=True, duration=0.4)
         time.sleep(0.5)
 
         # Return
-        self.servo_controller.set_left_eyelid(current_left, smooth=True, duration=0.6)
-        self.servo_controller.set_right_eyelid(current_right, smooth=True, duration=0.6)
+        self.servo_controller.set_eyelids(current_left, current_right, smooth=True, duration=0.6)
 
         logger.debug("Sigh")
 
@@ -33,6 +33,12 @@ import cv2
 import sounddevice as sd
 import soundfile as sf
 
+# libyaml C parser when PyYAML was built with it (pure-Python fallback)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 # =============================================================================
 # RATE LIMITER
@@ -145,7 +151,7 @@ class GairiHeadServer:
             config_path = Path(__file__).parent.parent / 'config' / 'gairi_head.yaml'
 
         with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=YamlLoader)
 
         # Security: API token authentication
         # Token can be set via environment variable or config file
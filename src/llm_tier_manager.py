@@ -27,12 +27,45 @@ Future Capability:
 - Currently unused - all intelligence delegated to Gary
 """
 
+import base64
+import io
 import requests
 import json
 import time
+import wave
+import numpy as np
 import websocket
 from loguru import logger
 
+
+def _encode_wav_base64(audio_data, sample_rate):
+    """
+    Encode audio as a base64 16-bit mono WAV for Gary
+
+    Args:
+        audio_data: numpy array of samples - int16 PCM is sent as-is, float
+                    (-1.0 to 1.0) is clipped and converted
+        sample_rate: Audio sample rate
+
+    Returns:
+        str: base64 WAV
+    """
+    if audio_data.dtype == np.int16:
+        audio_int16 = audio_data
+    else:
+        # Clip first - out-of-range floats would wrap around in the int16 cast
+        audio_int16 = np.clip(audio_data * 32767, -32768, 32767).astype(np.int16)
+
+    wav_buffer = io.BytesIO()
+    with wave.open(wav_buffer, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)  # 16-bit
+        wf.setframerate(sample_rate)
+        wf.writeframes(audio_int16.tobytes())
+
+    return base64.b64encode(wav_buffer.getvalue()).decode('utf-8')
+
+
 class LLMTierManager:
     """Manages two-tier LLM system for cost optimization"""
 
@@ -332,7 +365,7 @@ class LLMTierManager:
         Uses faster-whisper on Gary server for near-instant transcription
 
         Args:
-            audio_data: numpy array of audio samples (float32)
+            audio_data: numpy array of audio samples (float32, or int16 PCM as-is)
             sample_rate: Audio sample rate (default 16000)
             authorization: Authorization context from face recognition
 
@@ -340,27 +373,11 @@ class LLMTierManager:
             str: Transcribed text or None on failure
         """
         try:
-            import base64
-            import io
-            import wave
-            import numpy as np
-
             logger.info("📤 Sending audio to Gary for transcription...")
             start_time = time.time()
 
-            # Convert numpy audio to WAV bytes
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(sample_rate)
-
-                # Convert float32 to int16
-                audio_int16 = (audio_data * 32767).astype(np.int16)
-                wf.writeframes(audio_int16.tobytes())
-
-            # Encode to base64
-            audio_base64 = base64.b64encode(wav_buffer.getvalue()).decode('utf-8')
+            # 16-bit PCM WAV, base64 for the JSON message
+            audio_base64 = _encode_wav_base64(audio_data, sample_rate)
 
             # Build JSON message for Gary (v3.1 format)
             message = {
@@ -425,7 +442,7 @@ class LLMTierManager:
         Replaces the pattern of: transcribe_audio() → query()
 
         Args:
-            audio_data: numpy array of audio samples (float32)
+            audio_data: numpy array of audio samples (float32, or int16 PCM as-is)
             sample_rate: Audio sample rate (default 16000)
             authorization: Authorization context from face recognition
 
@@ -440,47 +457,10 @@ class LLMTierManager:
             }
         """
         try:
-            import base64
-            import io
-            import wave
-            import numpy as np
-
             logger.info("📤 Sending audio to Gary for full pipeline processing...")
             start_time = time.time()
 
-            # Convert numpy audio to WAV bytes
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(sample_rate)
-
-                # Convert float32 to int16
-                audio_int16 = (audio_data * 32767).astype(np.int16)
-                wf.writeframes(audio_int16.tobytes())
-
-            # Encode to base64
-            audio_base64 = base64.b64encode(wav_buffer.getvalue()).decode('utf-8')
-
-            # Build JSON message for Gary (OPTIMIZED FORMAT)
-            message = {
-                'audio': audio_base64,
-                'source': 'gairihead',
-                'process_full_pipeline': True,  # NEW: Request full processing
-                'tier_preference': 'auto',  # Let Gary decide based on content
-                'authorization': authorization or {
-                    'level': 3,  # Default: stranger
-                    'user': 'unknown',
-                    'confidence': 0.0
-                }
-            }
-
-            logger.info(f"📋 Authorization: level={message['authorization']['level']}, "
-                       f"user={message['authorization']['user']}, "
-                       f"confidence={message['authorization']['confidence']}")
-            logger.debug(f"Sending full pipeline request to Gary: "
-                        f"auth_level={message['authorization']['level']}, "
-                        f"audio_size={len(audio_base64)} bytes")
+            message = self._pipeline_message(audio_data, sample_rate, authorization)
 
             # Connect to Gary websocket
             ws = websocket.create_connection(
@@ -497,44 +477,150 @@ class LLMTierManager:
             response_data = ws.recv()
             ws.close()
 
-            processing_time = int((time.time() - start_time) * 1000)
+            return self._pipeline_result(response_data, start_time)
 
-            # Parse JSON response
-            try:
-                result = json.loads(response_data)
-            except json.JSONDecodeError:
-                # Fallback: Old format (just text response)
-                logger.warning("Gary returned plain text - may need Gary server update")
-                result = {
-                    'transcription': '',
-                    'response': response_data,
-                    'tier': 'unknown'
-                }
+        except Exception as e:
+            logger.error(f"❌ Full pipeline processing failed: {e}")
+            return None
 
-            # Add metadata
-            result['time_ms'] = processing_time
-            result['tokens'] = len(result.get('response', '').split())
-            result['confidence'] = 1.0 if result.get('tier') == 'cloud' else 0.8
+    def stream_audio_query(self, audio_data, sample_rate=16000, authorization=None):
+        """
+        Full pipeline (transcribe + LLM query) with the response streamed back
 
-            # Log which model was used (important for debugging Gary server tier selection)
-            model_used = result.get('model', 'unknown')
-            tier_used = result.get('tier', 'unknown')
+        Same request as process_audio_query() plus 'stream': True. A streaming
+        Gary sends {'delta': text} messages while the LLM generates, then the
+        usual result JSON. A Gary without streaming ignores the flag and sends
+        only the result, so this then behaves like process_audio_query().
 
-            logger.success(f"✅ Gary processed full pipeline ({processing_time}ms)")
-            logger.info(f"   Tier: {tier_used} | Model: {model_used}")
-            logger.info(f"   Transcription: \"{result.get('transcription', '')[:50]}...\"")
+        Deltas are raw LLM text (stage direction markers not stripped yet), and
+        a delta may carry the reply's 'emotion' before the result does. The
+        result's 'response' is the authoritative reply text.
 
-            self.stats['total_queries'] += 1
-            if result.get('tier') == 'local':
-                self.stats['local_queries'] += 1
-            elif result.get('tier') == 'cloud':
-                self.stats['cloud_queries'] += 1
+        Args:
+            audio_data: numpy array of audio samples (float32, or int16 PCM as-is)
+            sample_rate: Audio sample rate (default 16000)
+            authorization: Authorization context from face recognition
 
-            return result
+        Yields:
+            Partial message dicts ({'delta': str, ...}), then the result dict
+            (same fields as process_audio_query). Nothing more on failure
+        """
+        ws = None
+        try:
+            logger.info("📤 Sending audio to Gary for streamed pipeline processing...")
+            start_time = time.time()
+
+            message = self._pipeline_message(audio_data, sample_rate, authorization)
+            message['stream'] = True
+
+            ws = websocket.create_connection(
+                self.gary_ws_url,
+                timeout=30.0  # Full processing can take longer
+            )
+            ws.send(json.dumps(message))
+
+            while True:
+                response_data = ws.recv()
+                try:
+                    partial = json.loads(response_data)
+                except json.JSONDecodeError:
+                    partial = None
+                if isinstance(partial, dict) and 'delta' in partial and 'response' not in partial:
+                    yield partial
+                    continue
+                # Anything else ends the stream - the complete result
+                yield self._pipeline_result(response_data, start_time)
+                return
 
         except Exception as e:
-            logger.error(f"❌ Full pipeline processing failed: {e}")
-            return None
+            logger.error(f"❌ Streamed pipeline processing failed: {e}")
+
+        finally:
+            if ws is not None:
+                ws.close()
+
+    def _pipeline_message(self, audio_data, sample_rate, authorization):
+        """
+        Build Gary's full pipeline request
+
+        Args:
+            audio_data: numpy array of audio samples
+            sample_rate: Audio sample rate
+            authorization: Authorization context (None = stranger)
+
+        Returns:
+            JSON-serializable request dict
+        """
+        # 16-bit PCM WAV, base64 for the JSON message
+        audio_base64 = _encode_wav_base64(audio_data, sample_rate)
+
+        # Build JSON message for Gary (OPTIMIZED FORMAT)
+        message = {
+            'audio': audio_base64,
+            'source': 'gairihead',
+            'process_full_pipeline': True,  # NEW: Request full processing
+            'tier_preference': 'auto',  # Let Gary decide based on content
+            'authorization': authorization or {
+                'level': 3,  # Default: stranger
+                'user': 'unknown',
+                'confidence': 0.0
+            }
+        }
+
+        logger.info(f"📋 Authorization: level={message['authorization']['level']}, "
+                   f"user={message['authorization']['user']}, "
+                   f"confidence={message['authorization']['confidence']}")
+        logger.debug(f"Sending full pipeline request to Gary: "
+                    f"auth_level={message['authorization']['level']}, "
+                    f"audio_size={len(audio_base64)} bytes")
+
+        return message
+
+    def _pipeline_result(self, response_data, start_time):
+        """
+        Parse Gary's full pipeline result, add metadata and update stats
+
+        Args:
+            response_data: Raw websocket message with the result
+            start_time: time.time() when the request started
+
+        Returns:
+            Result dict (see process_audio_query)
+        """
+        processing_time = int((time.time() - start_time) * 1000)
+
+        # Parse JSON response
+        try:
+            result = json.loads(response_data)
+        except json.JSONDecodeError:
+            # Fallback: Old format (just text response)
+            logger.warning("Gary returned plain text - may need Gary server update")
+            result = {
+                'transcription': '',
+                'response': response_data,
+                'tier': 'unknown'
+            }
+
+        # Add metadata
+        result['time_ms'] = processing_time
+        result['tokens'] = len(result.get('response', '').split())
+        result['confidence'] = 1.0 if result.get('tier') == 'cloud' else 0.8
+
+        # Log which model was used (important for debugging Gary server tier selection)
+        model_used = result.get('model', 'unknown')
+        tier_used = result.get('tier', 'unknown')
+
+        logger.success(f"✅ Gary processed full pipeline ({processing_time}ms)")
+        logger.info(f"   Tier: {tier_used} | Model: {model_used}")
+        logger.info(f"   Transcription: \"{result.get('transcription', '')[:50]}...\"")
+
+        self.stats['total_queries'] += 1
+        if result.get('tier') == 'local':
+            self.stats['local_queries'] += 1
+        elif result.get('tier') == 'cloud':
+            self.stats['cloud_queries'] += 1
+
+        return result
 
     def get_stats(self):
         """
@@ -9,6 +9,11 @@ Hardware:
 - Pico GP3: Right eye ring (12 pixels)
 - Pico GP0 (UART TX): Communication to Pi 5
 - Pico GP1 (UART RX): Communication from Pi 5
+
+Deploy with scripts/deploy_pico.sh - precompiles this module to a
+bytecode .mpy with mpy-cross when available (code.py then just imports
+it and calls main(), falling back to a copy of this source), otherwise
+copies it as code.py.
 """
 
 import board
@@ -39,6 +44,13 @@ animation_speed = 2000  # ms
 animation_step = 0
 last_update = time.monotonic()
 
+# Chase trail brightness as integer scales (256 = full), head to tail
+CHASE_TRAIL_SCALES = (256, 171, 85)
+
+# Active animation, resolved by set_expression()
+animation_fn = None
+animation_interval = 0.0
+
 
 def parse_command(cmd):
     """
@@ -83,56 +95,67 @@ def parse_command(cmd):
         return "ERR:unknown_command"
 
 
+# Expression presets
+EXPRESSIONS = {
+    'idle': {
+        'color': (0, 100, 255),
+        'brightness': 128,
+        'animation': 'pulse',
+        'speed': 2000
+    },
+    'listening': {
+        'color': (0, 255, 255),
+        'brightness': 200,
+        'animation': 'solid',
+        'speed': 0
+    },
+    'thinking': {
+        'color': (0, 200, 255),
+        'brightness': 180,
+        'animation': 'chase',
+        'speed': 1000
+    },
+    'alert': {
+        'color': (255, 50, 0),
+        'brightness': 255,
+        'animation': 'flash',
+        'speed': 500
+    },
+    'happy': {
+        'color': (0, 255, 100),
+        'brightness': 200,
+        'animation': 'smile',
+        'speed': 800
+    },
+    'sarcasm': {
+        'color': (255, 180, 0),
+        'brightness': 150,
+        'animation': 'side_eye',
+        'speed': 0
+    }
+}
+
+
 def set_expression(expression):
     """Load expression preset"""
     global current_expression, current_color, current_brightness, animation_speed
+    global animation_fn, animation_interval
 
-    expressions = {
-        'idle': {
-            'color': (0, 100, 255),
-            'brightness': 128,
-            'animation': 'pulse',
-            'speed': 2000
-        },
-        'listening': {
-            'color': (0, 255, 255),
-            'brightness': 200,
-            'animation': 'solid',
-            'speed': 0
-        },
-        'thinking': {
-            'color': (0, 200, 255),
-            'brightness': 180,
-            'animation': 'chase',
-            'speed': 1000
-        },
-        'alert': {
-            'color': (255, 50, 0),
-            'brightness': 255,
-            'animation': 'flash',
-            'speed': 500
-        },
-        'happy': {
-            'color': (0, 255, 100),
-            'brightness': 200,
-            'animation': 'smile',
-            'speed': 800
-        },
-        'sarcasm': {
-            'color': (255, 180, 0),
-            'brightness': 150,
-            'animation': 'side_eye',
-            'speed': 0
-        }
-    }
-
-    if expression in expressions:
-        expr = expressions[expression]
+    if expression in EXPRESSIONS:
+        expr = EXPRESSIONS[expression]
         current_expression = expression
         current_color = expr['color']
         current_brightness = expr['brightness']
         animation_speed = expr['speed']
 
+        # Resolve animation once here so update_animation() is a single
+        # time check + call (30 steps per cycle)
+        if animation_speed:
+            animation_fn = ANIMATIONS.get(expr['animation'])
+            animation_interval = animation_speed / 1000.0 / 30
+        else:
+            animation_fn = None
+
 
 def set_color(rgb):
     """Set solid color"""
@@ -163,6 +186,17 @@ def trigger_animation(animation):
 # ANIMATIONS
 # ============================================================================
 
+def scale_color(rgb, scale):
+    """
+    Scale an (r, g, b) color with integer math
+
+    Args:
+        rgb: (r, g, b) tuple, 0-255 per channel
+        scale: 0-256 (256 = unchanged)
+    """
+    return ((rgb[0] * scale) >> 8, (rgb[1] * scale) >> 8, (rgb[2] * scale) >> 8)
+
+
 def animate_pulse():
     """Smooth brightness pulse"""
     global animation_step
@@ -170,12 +204,10 @@ def animate_pulse():
     brightness_factor = (math.sin(animation_step * 0.05) + 1) / 2  # 0.0 to 1.0
     brightness = int(current_brightness * brightness_factor)
 
-    for i in range(PIXEL_COUNT):
-        r = int(current_color[0] * brightness / 255)
-        g = int(current_color[1] * brightness / 255)
-        b = int(current_color[2] * brightness / 255)
-        left_eye[i] = (r, g, b)
-        right_eye[i] = (r, g, b)
+    # Every pixel gets the same color - scale once, fill in one call
+    color = scale_color(current_color, (brightness * 257) >> 8)
+    left_eye.fill(color)
+    right_eye.fill(color)
 
     left_eye.show()
     right_eye.show()
@@ -185,21 +217,17 @@ def animate_pulse():
 def animate_chase():
     """Rotating chase pattern"""
     global animation_step
-    trail_length = 3
 
     # Clear all
     left_eye.fill((0, 0, 0))
     right_eye.fill((0, 0, 0))
 
     # Set trail
-    for i in range(trail_length):
+    for i, scale in enumerate(CHASE_TRAIL_SCALES):
         pos = (animation_step + i) % PIXEL_COUNT
-        brightness_factor = (trail_length - i) / trail_length
-        r = int(current_color[0] * brightness_factor)
-        g = int(current_color[1] * brightness_factor)
-        b = int(current_color[2] * brightness_factor)
-        left_eye[pos] = (r, g, b)
-        right_eye[pos] = (r, g, b)
+        color = scale_color(current_color, scale)
+        left_eye[pos] = color
+        right_eye[pos] = color
 
     left_eye.show()
     right_eye.show()
@@ -223,17 +251,13 @@ def animate_flash():
 
 def animate_smile():
     """Bottom pixels brighter (smile shape)"""
-    # Pixels 3-9 are bottom arc (smile)
-    for i in range(PIXEL_COUNT):
-        if 3 <= i <= 9:
-            left_eye[i] = current_color
-            right_eye[i] = current_color
-        else:
-            r = int(current_color[0] * 0.4)
-            g = int(current_color[1] * 0.4)
-            b = int(current_color[2] * 0.4)
-            left_eye[i] = (r, g, b)
-            right_eye[i] = (r, g, b)
+    # Dim base (40%), then pixels 3-9 are bottom arc (smile)
+    dim = scale_color(current_color, 102)
+    left_eye.fill(dim)
+    right_eye.fill(dim)
+    for i in range(3, 10):
+        left_eye[i] = current_color
+        right_eye[i] = current_color
 
     left_eye.show()
     right_eye.show()
@@ -242,11 +266,8 @@ def animate_smile():
 def animate_side_eye():
     """One ring dimmer (side-eye effect)"""
     left_eye.fill(current_color)
-    # Right eye dimmer
-    r = int(current_color[0] * 0.3)
-    g = int(current_color[1] * 0.3)
-    b = int(current_color[2] * 0.3)
-    right_eye.fill((r, g, b))
+    # Right eye dimmer (30%)
+    right_eye.fill(scale_color(current_color, 77))
 
     left_eye.show()
     right_eye.show()
@@ -265,35 +286,30 @@ def animate_blink():
     set_color(current_color)
 
 
+# Animation name (from EXPRESSIONS) -> frame function
+ANIMATIONS = {
+    'pulse': animate_pulse,
+    'chase': animate_chase,
+    'flash': animate_flash,
+    'smile': animate_smile,
+    'side_eye': animate_side_eye,
+}
+
+
 def update_animation():
     """Main animation loop - call repeatedly"""
     global last_update
 
-    now = time.monotonic()
-    if animation_speed == 0:
+    if animation_fn is None:
         return  # No animation
 
     # Check if it's time to update
-    interval = animation_speed / 1000.0  # Convert ms to seconds
-    if now - last_update < interval / 30:  # 30 steps per cycle
+    now = time.monotonic()
+    if now - last_update < animation_interval:
         return
 
     last_update = now
-
-    # Run appropriate animation
-    if current_expression == "idle":
-        animate_pulse()
-    elif current_expression == "thinking":
-        animate_chase()
-    elif current_expression == "alert":
-        animate_flash()
-    elif current_expression == "happy":
-        animate_smile()
-    elif current_expression == "sarcasm":
-        animate_side_eye()
-    elif current_expression == "listening":
-        # Solid - no animation
-        set_color(current_color)
+    animation_fn()
 
 
 # ============================================================================
@@ -10,20 +10,483 @@ Hardware (M.2 HAT safe pins):
 v2.0 - Enhanced with smooth interpolation, micro-expressions, TARS personality
 """
 
+import os
 import time
 import math
 import random
+import heapq
+import itertools
 import threading
+from dataclasses import dataclass, replace
+import numpy as np
 from gpiozero import Servo, Device
 from gpiozero.pins.lgpio import LGPIOFactory
 from loguru import logger
 import yaml
 from pathlib import Path
 
+# Consecutive trajectory values closer than this are the same PWM pulse
+# (servo units: 0.005 ≈ 5µs of a 0.5-2.5ms pulse) - only the first is written
+_WRITE_TOL = 0.005
+
+# Smallest trajectory step worth its own write (servo units) - short moves
+# get fewer steps, so 0.03 of travel animates in 3 steps, not 15
+_STEP_RES = 0.01
+
+# Writer doesn't bother waiting for less than this - OS wakeup jitter is
+# of the same order, so the write just goes out (nanoseconds)
+_MIN_WAIT_NS = 200_000
+
+# GPIOs wired to the hardware PWM peripheral (12/13 clash with the M.2 HAT)
+_HW_PWM_PINS = (12, 13, 18, 19)
+
+# Expression definitions (resolved once at import)
+_EXPR_PATH = Path(__file__).resolve().parent.parent / 'config' / 'expressions.yaml'
+
+# libyaml C parser when PyYAML was built with it (pure-Python fallback)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# pigpio is optional - DMA-timed PWM via pigpiod (not supported on the Pi 5's RP1)
+try:
+    from gpiozero.pins.pigpio import PiGPIOFactory
+    PIGPIO_AVAILABLE = True
+except ImportError:
+    PIGPIO_AVAILABLE = False
+
+# fastrlock is optional - C reentrant lock with a faster uncontended acquire
+try:
+    from fastrlock.rlock import FastRLock
+    FASTRLOCK_AVAILABLE = True
+except ImportError:
+    FASTRLOCK_AVAILABLE = False
+    FastRLock = threading.RLock
+
+# Numba is optional - JIT-compiles the easing math when installed (Pi 5 / ARMv8)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (plain Python fallback)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# =============================================================================
+# CALIBRATION
+# =============================================================================
+
+# Linear angle → servo value coefficients (value = A * angle + B), from
+# precise_servo_calibration.py - see the angle_to_servo_value_* docstrings
+# Physical angle limits (degrees) - eyes stop at 75° (mechanism limit)
+_EYE_MAX = 75
+_MOUTH_MAX = 60
+
+_LEFT_A = -0.410 / _EYE_MAX     # 0° → 0.100, 75° → -0.310
+_LEFT_B = 0.100
+_RIGHT_A = 0.410 / _EYE_MAX     # 0° → -0.100, 75° → 0.310 (mirrored)
+_RIGHT_B = -0.100
+_MOUTH_A = -0.600 / _MOUTH_MAX  # 0° → 0.000, 60° → -0.600
+_MOUTH_B = 0.0
+
+
+# =============================================================================
+# EASING FUNCTIONS
+# =============================================================================
+
+@njit(cache=True, fastmath=True)
+def ease_in_out_cubic(t):
+    """
+    Cubic easing function for smooth, natural movement
+
+    Args:
+        t: Progress from 0 to 1
+
+    Returns:
+        Eased value (0 to 1)
+    """
+    if t < 0.5:
+        return 4 * t * t * t
+    else:
+        p = 2 * t - 2
+        return 1 + p * p * p / 2
+
+
+# Bounce segments: upper bound, parabola centre offset and floor per bounce
+_BOUNCE_THRESH = (1 / 2.75, 2 / 2.75, 2.5 / 2.75)
+_BOUNCE_OFF = (0.0, 1.5 / 2.75, 2.25 / 2.75, 2.625 / 2.75)
+_BOUNCE_ADD = (0.0, 0.75, 0.9375, 0.984375)
+
+
+@njit(cache=True, fastmath=True)
+def ease_out_bounce(t):
+    """
+    Bounce easing for playful expressions
+
+    Args:
+        t: Progress from 0 to 1
+
+    Returns:
+        Eased value with bounce (0 to 1)
+    """
+    # Segment index from the thresholds, then one shared parabola
+    i = (t >= _BOUNCE_THRESH[0]) + (t >= _BOUNCE_THRESH[1]) + (t >= _BOUNCE_THRESH[2])
+    u = t - _BOUNCE_OFF[i]
+    return 7.5625 * u * u + _BOUNCE_ADD[i]
+
+
+# Easing name → id for the compiled table builder
+_EASE_IDS = {'linear': 0, 'cubic': 1, 'bounce': 2}
+
+
+@njit(cache=True)
+def _build_ease_table(easing_id, steps):
+    """
+    Evaluate an easing function over steps + 1 evenly spaced points
+
+    Args:
+        easing_id: Value from _EASE_IDS (unknown ids are linear)
+        steps: Number of interpolation steps
+
+    Returns:
+        float32 ndarray of eased progress values (0 to 1)
+    """
+    out = np.empty(steps + 1, dtype=np.float32)
+    for i in range(steps + 1):
+        t = i / steps
+        if easing_id == 1:
+            out[i] = ease_in_out_cubic(t)
+        elif easing_id == 2:
+            out[i] = ease_out_bounce(t)
+        else:
+            out[i] = t
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT so the first expression isn't delayed by compilation
+    ease_in_out_cubic(0.5)
+    ease_out_bounce(0.5)
+    _build_ease_table(1, 15)
+
+
+# Eased progress arrays keyed by (easing, steps) - built once, then reused.
+# float32 is ample for servo resolution and keeps each table small
+_EASE_CACHE = {}
+
+
+def _get_ease_table(easing, steps):
+    """
+    Get the eased progress values for a transition, building them on first use
+
+    Args:
+        easing: 'cubic', 'bounce', or 'linear'
+        steps: Number of interpolation steps
+
+    Returns:
+        float32 ndarray of steps + 1 eased progress values (0 to 1)
+    """
+    key = (easing, steps)
+    table = _EASE_CACHE.get(key)
+    if table is None:
+        table = _build_ease_table(_EASE_IDS.get(easing, 0), steps)
+        table.flags.writeable = False
+        _EASE_CACHE[key] = table
+    return table
+
+
+# Closed-lid keyframes for blink/wink: one curve covering close → hold →
+# reopen on a uniform timebase, as fraction of the way to closed (0 open,
+# 1 closed). Keyed by (close, hold, reopen) frame counts
+_LID_PROFILES = {}
+
+
+def _get_lid_profile(close, hold, reopen):
+    """
+    Get a close/hold/reopen keyframe curve, building it on first use
+
+    Args:
+        close: Frames to close (cubic eased)
+        hold: Frames from fully closed to the start of the reopen
+        reopen: Frames to reopen (cubic eased)
+
+    Returns:
+        float32 ndarray of close + hold + reopen + 1 values (0 to 1)
+    """
+    key = (close, hold, reopen)
+    profile = _LID_PROFILES.get(key)
+    if profile is None:
+        profile = np.concatenate((
+            _get_ease_table('cubic', close),
+            np.ones(hold - 1, dtype=np.float32),
+            1 - _get_ease_table('cubic', reopen),
+        ))
+        profile.flags.writeable = False
+        _LID_PROFILES[key] = profile
+    return profile
+
+
+# =============================================================================
+# SPEECH WAVEFORM
+# =============================================================================
+
+# Talking motion precomputed once: primary ~6 Hz + secondary ~4 Hz at 30 FPS
+# (frame * 1.2 and frame * 0.8 rad). Each utterance renders mouth positions
+# from this plus fresh noise (see ServoController._render_speech_frames)
+_SPEECH_WAVE_LEN = 1024
+_speech_idx = np.arange(_SPEECH_WAVE_LEN)
+_SPEECH_WAVE = np.sin(_speech_idx * 1.2) + np.sin(_speech_idx * 0.8) * 0.3
+_SPEECH_WAVE.flags.writeable = False
+del _speech_idx
+
+# Private PCG64 generator (OS-entropy seeded) for speech phase + noise - only
+# the speech animation thread draws from it, so no shared global RNG state
+_SPEECH_RNG = np.random.default_rng()
+
+
+def _debug_enabled():
+    """True if any loguru sink accepts DEBUG - check once, outside hot loops"""
+    try:
+        return logger._core.min_level <= 10
+    except AttributeError:  # loguru internals changed - assume enabled
+        return True
+
+
+# =============================================================================
+# KERNEL PWM
+# =============================================================================
+
+class SysfsPwmServo:
+    """
+    Servo on a kernel PWM channel (/sys/class/pwm), e.g. the pwm-gpio driver
+
+    Drop-in for the parts of gpiozero.Servo the controller uses (value,
+    detach, close). Pulse edges come from a kernel hrtimer, so Python
+    stalls don't show up as jitter. Enabled by hardware.servos.kernel_pwm
+    in gairi_head.yaml.
+    """
+
+    __slots__ = ('_dir', '_fd', '_mid_ns', '_half_ns', '_value')
+
+    def __init__(self, chip, channel, min_pulse_width=0.5/1000, max_pulse_width=2.5/1000,
+                 frame_width=20/1000):
+        """
+        Export and configure a PWM channel
+
+        Args:
+            chip: pwmchip number
+            channel: Channel number on that chip
+            min_pulse_width: Pulse width for value -1 (seconds)
+            max_pulse_width: Pulse width for value 1 (seconds)
+            frame_width: PWM period (seconds)
+
+        Raises:
+            OSError: Chip/channel missing or not writable
+        """
+        chip_dir = Path(f'/sys/class/pwm/pwmchip{chip}')
+        self._dir = chip_dir / f'pwm{channel}'
+        if not self._dir.exists():
+            (chip_dir / 'export').write_text(str(channel))
+        (self._dir / 'period').write_text(str(int(frame_width * 1e9)))
+        self._mid_ns = (min_pulse_width + max_pulse_width) / 2 * 1e9
+        self._half_ns = (max_pulse_width - min_pulse_width) / 2 * 1e9
+        self._value = None
+        # duty_cycle stays open - each write is a single pwrite()
+        self._fd = os.open(self._dir / 'duty_cycle', os.O_WRONLY)
+
+    @property
+    def value(self):
+        """Position -1 to 1, None while detached"""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if value is None:
+            self.detach()
+            return
+        value = -1.0 if value < -1 else (1.0 if value > 1 else value)
+        os.pwrite(self._fd, b'%d' % int(self._mid_ns + self._half_ns * value), 0)
+        if self._value is None:
+            (self._dir / 'enable').write_text('1')
+        self._value = value
+
+    def detach(self):
+        """Stop the pulse train (servo goes limp)"""
+        if self._value is not None:
+            (self._dir / 'enable').write_text('0')
+            self._value = None
+
+    def close(self):
+        """Disable and unexport the channel"""
+        if self._fd is None:
+            return
+        self.detach()
+        os.close(self._fd)
+        self._fd = None
+        try:
+            (self._dir.parent / 'unexport').write_text(self._dir.name[3:])
+        except OSError:
+            pass
+
+
+class ServoWriter:
+    """
+    Dedicated real-time thread that actuates servo trajectories
+
+    Callers plan a trajectory (list of servo values) and hand it off;
+    this thread writes each value at its absolute deadline so timing is
+    decoupled from the planning thread (and from loguru/GIL stalls there).
+
+    Items are (deadline, seq, servo, value, expires, done) tuples in a
+    heap ordered by deadline, so trajectories for different servos
+    submitted back-to-back are interleaved rather than played in
+    sequence. The heap is guarded by a Condition: the writer waits on it
+    until the next deadline, so an earlier item (or a cancel) wakes it
+    immediately. If the writer falls behind, intermediate values that are
+    more than one step late are dropped instead of replayed late; the
+    final value of a trajectory is always written.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='servo-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, servo, values, step_delay, delay=0.0):
+        """
+        Queue a trajectory for playback
+
+        Args:
+            servo: Servo object to drive
+            values: Sequence of servo values (-1 to 1), one per step
+            step_delay: Seconds between consecutive writes
+            delay: Seconds to wait before the first write
+
+        Returns:
+            threading.Event set once the trajectory has fully played out
+            (or been cancelled)
+        """
+        done = threading.Event()
+        # Integer-nanosecond deadlines - no float rounding drift across steps
+        tick = int(step_delay * 1e9)
+        start = time.monotonic_ns() + int(delay * 1e9)
+        last = len(values) - 1
+        prev = math.inf
+        with self._cond:
+            for i, value in enumerate(values):
+                # Skip steps that wouldn't change the pulse (ease-in/out tails)
+                if i != last and abs(value - prev) < _WRITE_TOL:
+                    continue
+                prev = value
+                deadline = start + i * tick
+                expires = math.inf if i == last else deadline + tick
+                heapq.heappush(self._heap, (deadline, next(self._seq), servo, value, expires, None))
+            # Completion marker fires one step after the last write (matches the
+            # old write-then-sleep loop, so callers see the same total duration)
+            heapq.heappush(self._heap, (start + len(values) * tick, next(self._seq),
+                                        servo, None, math.inf, done))
+            self._cond.notify()
+        return done
+
+    def cancel(self, servo):
+        """
+        Drop every queued write for a servo
+
+        Waiters on the cancelled trajectories are released.
+
+        Args:
+            servo: Servo object whose pending writes should be discarded
+        """
+        with self._cond:
+            keep = []
+            for item in self._heap:
+                if item[2] is not servo:
+                    keep.append(item)
+                elif item[5] is not None:
+                    item[5].set()
+            heapq.heapify(keep)
+            self._heap = keep
+            self._cond.notify()
+
+    def stop(self):
+        """Stop the writer thread (pending writes are discarded)"""
+        with self._cond:
+            self._running = False
+            for item in self._heap:
+                if item[5] is not None:
+                    item[5].set()
+            self._heap = []
+            self._cond.notify()
+        self._thread.join(timeout=1.0)
+
+    def _run(self):
+        """Writer loop - wait for each deadline, then write (dropping stale frames)"""
+        while True:
+            with self._cond:
+                while self._running:
+                    heap = self._heap
+                    if not heap:
+                        self._cond.wait()
+                        continue
+                    remaining = heap[0][0] - time.monotonic_ns()
+                    if remaining <= _MIN_WAIT_NS:
+                        break
+                    self._cond.wait(remaining / 1e9)
+                if not self._running:
+                    return
+                _, _, servo, value, expires, done = heapq.heappop(heap)
+                late = time.monotonic_ns() > expires
+
+            if done is not None:
+                done.set()
+                continue
+
+            if late:
+                continue  # Overran - skip this frame, a newer one is due
+
+            try:
+                servo.value = value
+            except Exception as e:
+                logger.debug(f"Servo write failed: {e}")
+
+
+@dataclass(frozen=True)
+class _Config:
+    """Parsed configuration, built once by ServoController._load_config()"""
+    raw: dict           # Full gairi_head.yaml
+    servos: dict        # hardware.servos section
+    expressions: dict   # expressions.yaml 'expressions' table
+
 
 class ServoController:
     """Manages servo positions for eyelids and mouth"""
 
+    # Fixed attribute set - slot access is cheaper than the instance dict on
+    # the hot paths (speech loop, set_* methods). New attributes go here too.
+    __slots__ = (
+        'config', '_hw_pwm', '_kernel_pwm', '_pi', '_mouth_pin', '_mouth_hw_pwm',
+        'left_eyelid', 'right_eyelid', 'mouth',
+        'left_config', 'right_config', 'mouth_config',
+        'current_left', 'current_right', 'current_mouth',
+        '_left_lock', '_right_lock', '_mouth_lock',
+        'blink_variation', '_blink_jitter', '_blink_jitter_i',
+        'lazy_eye_enabled', 'lazy_eye_delay',
+        'speech_animation_active', '_speech_animation_thread', '_speech_stop',
+        '_speech_start', '_speech_done', '_speech_params', '_mouth_target',
+        'idle_detach_enabled', 'last_movement_time', 'detach_delay',
+        '_detach_deadline', '_watchdog_stop', '_watchdog',
+        '_writer',
+    )
+
     def __init__(self, config_path=None):
         """Initialize servos with config"""
         if config_path is None:
@@ -32,70 +495,138 @@ class ServoController:
 
         self.config = self._load_config(config_path)
 
-        # Use lgpio for Pi 5 (native GPIO library)
-        try:
-            Device.pin_factory = LGPIOFactory()
-            factory = Device.pin_factory
-            logger.info("Using lgpio pin factory (Pi 5 native)")
-        except Exception as e:
-            logger.warning(f"lgpio not available, using default: {e}")
-            factory = None
-
-        # Initialize servos
-        servo_config = self.config['hardware']['servos']
-
-        # Use higher frame width for more stable PWM (reduces jitter)
-        self.left_eyelid = Servo(
-            servo_config['left_eyelid']['gpio_pin'],
-            min_pulse_width=0.5/1000,
-            max_pulse_width=2.5/1000,
-            frame_width=20/1000,  # 20ms = 50Hz (standard servo frequency)
-            pin_factory=factory
-        )
-
-        self.right_eyelid = Servo(
-            servo_config['right_eyelid']['gpio_pin'],
-            min_pulse_width=0.5/1000,
-            max_pulse_width=2.5/1000,
-            frame_width=20/1000,
-            pin_factory=factory
-        )
-
-        self.mouth = Servo(
-            servo_config['mouth']['gpio_pin'],
-            min_pulse_width=0.5/1000,
-            max_pulse_width=2.5/1000,
-            frame_width=20/1000,
-            pin_factory=factory
-        )
+        servo_config = self.config.servos
+
+        # Kernel PWM (pwm-gpio overlay, /sys/class/pwm) when configured -
+        # hrtimer-generated pulses, no pin factory involved
+        self._hw_pwm = False
+        self._kernel_pwm = False
+        kernel_pwm = servo_config.get('kernel_pwm')
+        if kernel_pwm:
+            try:
+                chip = kernel_pwm.get('chip', 0)
+                self.left_eyelid = SysfsPwmServo(chip, servo_config['left_eyelid']['pwm_channel'])
+                self.right_eyelid = SysfsPwmServo(chip, servo_config['right_eyelid']['pwm_channel'])
+                self.mouth = SysfsPwmServo(chip, servo_config['mouth']['pwm_channel'])
+                self._kernel_pwm = True
+                logger.info(f"Using kernel PWM (pwmchip{chip})")
+            except (OSError, KeyError) as e:
+                logger.warning(f"Kernel PWM not available, using GPIO pin factory: {e}")
+
+        factory = None
+        if not self._kernel_pwm:
+            # Prefer pigpio (hardware-timed PWM, needs pigpiod running), then
+            # lgpio for Pi 5 (native GPIO library, software-timed PWM)
+            if PIGPIO_AVAILABLE:
+                try:
+                    Device.pin_factory = PiGPIOFactory()
+                    factory = Device.pin_factory
+                    self._hw_pwm = True
+                    logger.info("Using pigpio pin factory (hardware-timed PWM)")
+                except Exception as e:
+                    logger.debug(f"pigpio not available, trying lgpio: {e}")
+
+            if factory is None:
+                try:
+                    Device.pin_factory = LGPIOFactory()
+                    factory = Device.pin_factory
+                    logger.info("Using lgpio pin factory (Pi 5 native)")
+                except Exception as e:
+                    logger.warning(f"lgpio not available, using default: {e}")
+
+            # Use higher frame width for more stable PWM (reduces jitter)
+            self.left_eyelid = Servo(
+                servo_config['left_eyelid']['gpio_pin'],
+                min_pulse_width=0.5/1000,
+                max_pulse_width=2.5/1000,
+                frame_width=20/1000,  # 20ms = 50Hz (standard servo frequency)
+                pin_factory=factory
+            )
+
+            self.right_eyelid = Servo(
+                servo_config['right_eyelid']['gpio_pin'],
+                min_pulse_width=0.5/1000,
+                max_pulse_width=2.5/1000,
+                frame_width=20/1000,
+                pin_factory=factory
+            )
+
+            self.mouth = Servo(
+                servo_config['mouth']['gpio_pin'],
+                min_pulse_width=0.5/1000,
+                max_pulse_width=2.5/1000,
+                frame_width=20/1000,
+                pin_factory=factory
+            )
 
         # Store angle ranges
         self.left_config = servo_config['left_eyelid']
         self.right_config = servo_config['right_eyelid']
         self.mouth_config = servo_config['mouth']
 
+        # Direct pigpio handle for the speech loop's mouth writes (pigpio only)
+        self._pi = factory.connection if self._hw_pwm else None
+        self._mouth_pin = self.mouth_config['gpio_pin']
+        # Mouth on a hardware-PWM pin: speech frames go to the PWM peripheral
+        # instead of pigpio's DMA-timed servo pulses (opt out: hardware_pwm: false)
+        self._mouth_hw_pwm = (self._pi is not None and self._mouth_pin in _HW_PWM_PINS
+                              and self.mouth_config.get('hardware_pwm', True))
+        if self._mouth_hw_pwm:
+            logger.info(f"Mouth speech animation on hardware PWM (GPIO {self._mouth_pin})")
+
         # Track current positions for smooth transitions
         self.current_left = self.left_config['neutral_angle']
         self.current_right = self.right_config['neutral_angle']
         self.current_mouth = self.mouth_config['neutral_angle']
 
-        # Movement lock for thread safety
-        self.movement_lock = threading.Lock()
+        # Per-servo locks - the three servos are physically independent, so a
+        # mouth transition must not block eyelid updates (and vice versa).
+        # Code that moves several servos acquires them in left → right → mouth order.
+        # Reentrant so composite actions (blink, wink, double_take, micro_expression)
+        # can hold them across all their phases while calling the set_* methods.
+        self._left_lock = FastRLock()
+        self._right_lock = FastRLock()
+        self._mouth_lock = FastRLock()
 
         # Personality settings
         self.blink_variation = 0.3  # 30% timing variation for natural blinks
+        # Precomputed blink timing multipliers (cycled, avoids random.uniform per blink)
+        self._blink_jitter = tuple(1 + random.uniform(-self.blink_variation, self.blink_variation)
+                                   for _ in range(64))
+        self._blink_jitter_i = 0
         self.lazy_eye_enabled = False  # Slight lag between eyes for character
         self.lazy_eye_delay = 0.05  # seconds
 
-        # Speech animation
+        # Speech animation - one long-lived animator thread, parked between
+        # utterances (no thread spawn per start_speech_animation)
         self.speech_animation_active = False
-        self._speech_animation_thread = None
+        self._speech_stop = threading.Event()  # Set to wake and stop the animation loop
+        self._speech_start = threading.Event()  # Set to run the loop with _speech_params
+        self._speech_done = threading.Event()  # Set while no loop is running
+        self._speech_done.set()
+        self._speech_params = None  # (base_amplitude, max_angle_override), None = shut down
+        # Mouth angle requested while speaking - the loop owns the mouth and
+        # holds it at least this open (plain attribute store, no lock)
+        self._mouth_target = None
+        self._speech_animation_thread = threading.Thread(target=self._speech_animator,
+                                                         name='servo-speech-animator', daemon=True)
+        self._speech_animation_thread.start()
 
         # Jitter reduction: detach servos when idle
-        self.idle_detach_enabled = True
+        # (not needed with pigpio or kernel PWM - their pulses don't jitter)
+        self.idle_detach_enabled = not (self._hw_pwm or self._kernel_pwm)
         self.last_movement_time = time.time()
         self.detach_delay = 2.0  # Seconds of no movement before detaching
-        self._detach_timer = None
+        # One long-lived watchdog detaches once the deadline passes (None = nothing pending)
+        self._detach_deadline = None
+        self._watchdog_stop = threading.Event()
+        self._watchdog = threading.Thread(target=self._idle_watchdog, name='servo-idle-watchdog',
+                                          daemon=True)
+        self._watchdog.start()
+
+
+        # Real-time writer thread - all timed (smooth) servo writes go through it
+        self._writer = ServoWriter()
 
         # Set to neutral
         self.reset_to_neutral()
@@ -103,9 +634,30 @@ class ServoController:
         logger.info("Servo controller initialized (v2.0 - smooth movement, jitter reduction enabled)")
 
     def _load_config(self, config_path):
-        """Load configuration file"""
+        """
+        Load gairi_head.yaml and expressions.yaml into one frozen _Config
+
+        Both files are read once here; set_expression() never touches disk.
+        A missing/broken expressions.yaml leaves the expression table empty.
+        """
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            raw = yaml.load(f, Loader=YamlLoader)
+        return _Config(
+            raw=raw,
+            servos=raw['hardware']['servos'],
+            expressions=self._load_expressions() or {},
+        )
+
+    def _load_expressions(self):
+        """Parse config/expressions.yaml, None on failure"""
+        try:
+            with open(_EXPR_PATH, 'r') as f:
+                expressions = yaml.load(f, Loader=YamlLoader)['expressions']
+            logger.debug(f"Loaded {len(expressions)} servo expressions")
+            return expressions
+        except Exception as e:
+            logger.warning(f"Failed to load expressions from {_EXPR_PATH}: {e}")
+            return None
 
     def reset_to_neutral(self):
         """Reset all servos to neutral position"""
@@ -119,21 +671,32 @@ class ServoController:
         if not self.idle_detach_enabled:
             return
 
-        # Cancel existing timer
-        if self._detach_timer:
-            self._detach_timer.cancel()
-
-        # Schedule new detach
-        self._detach_timer = threading.Timer(self.detach_delay, self._detach_servos)
-        self._detach_timer.daemon = True
-        self._detach_timer.start()
+        # (Re)arm the idle watchdog - replaces any pending detach
+        self.last_movement_time = time.time()
+        self._detach_deadline = time.monotonic() + self.detach_delay
+
+    def cancel_detach(self):
+        """Cancel a pending idle detach (e.g. before driving servos directly for speech)"""
+        self._detach_deadline = None
+
+    def _idle_watchdog(self):
+        """Idle watchdog loop - detach servos once the scheduled deadline passes"""
+        while not self._watchdog_stop.wait(0.5):
+            deadline = self._detach_deadline
+            if deadline is None or time.monotonic() < deadline:
+                continue
+            if self._detach_deadline is deadline:  # Not re-armed meanwhile
+                self._detach_deadline = None
+                self._detach_servos()
 
     def _detach_servos(self):
         """Detach servos to stop PWM and eliminate jitter when idle"""
         try:
             self.left_eyelid.detach()
             self.right_eyelid.detach()
-            self.mouth.detach()
+            # An eye move's timer must not cut the mouth off mid-speech
+            if not self.speech_animation_active:
+                self.mouth.detach()
             logger.debug("Servos detached (idle - no jitter)")
         except Exception as e:
             logger.debug(f"Servo detach failed: {e}")
@@ -141,9 +704,15 @@ class ServoController:
     def close(self):
         """Fully close servos and release GPIO pins (allows other processes to access)"""
         try:
-            # Cancel any pending detach timers
-            if hasattr(self, '_detach_timer') and self._detach_timer:
-                self._detach_timer.cancel()
+            # Stop the idle watchdog (no detach racing the close)
+            if hasattr(self, '_watchdog_stop'):
+                self._watchdog_stop.set()
+            if hasattr(self, '_speech_start'):
+                self._shutdown_speech_animator()
+
+            # Stop the writer thread before releasing the pins it drives
+            if hasattr(self, '_writer') and self._writer:
+                self._writer.stop()
 
             # Close all servos (releases GPIO pins)
             if hasattr(self, 'left_eyelid') and self.left_eyelid:
@@ -157,13 +726,28 @@ class ServoController:
         except Exception as e:
             logger.warning(f"Servo close failed: {e}")
 
-    def _attach_servos(self):
-        """Re-attach servos before movement"""
+    def _attach_servos(self, left=True, right=True, mouth=True):
+        """
+        Re-attach servos before movement
+
+        Only the servos about to move need attaching - in particular eye moves
+        leave the mouth alone, so they don't write over a running speech animation.
+
+        Args:
+            left: Attach the left eyelid
+            right: Attach the right eyelid
+            mouth: Attach the mouth
+        """
         try:
-            # Set servos to current known positions
-            self.left_eyelid.value = self.angle_to_servo_value_left_eye(self.current_left)
-            self.right_eyelid.value = self.angle_to_servo_value_right_eye(self.current_right)
-            self.mouth.value = self.angle_to_servo_value_mouth(self.current_mouth)
+            # Set servos to current known positions. Always through gpiozero, even
+            # with pigpio - a set_servo_pulsewidth() here would leave the pin in
+            # pigpio servo mode, where every later gpiozero .value write fails
+            if left:
+                self.left_eyelid.value = self.angle_to_servo_value_left_eye(self.current_left)
+            if right:
+                self.right_eyelid.value = self.angle_to_servo_value_right_eye(self.current_right)
+            if mouth:
+                self.mouth.value = self.angle_to_servo_value_mouth(self.current_mouth)
             logger.debug("Servos re-attached for movement")
         except Exception as e:
             logger.debug(f"Servo attach failed: {e}")
@@ -191,16 +775,9 @@ class ServoController:
 
         Note: Using 75° as max instead of 90° due to mechanism physical limit
         """
-        # Clamp to physical range
-        angle = max(0, min(75, angle))
-
-        # Normalize to 0-1 (0° = 0, 75° = 1)
-        normalized = angle / 75.0
-
-        # Map to calibrated servo range: 0.100 to -0.310
-        servo_value = 0.100 - (normalized * 0.410)
-
-        return servo_value
+        # Clamp to physical range, then map to calibrated servo range: 0.100 to -0.310
+        angle = 0 if angle < 0 else (_EYE_MAX if angle > _EYE_MAX else angle)
+        return _LEFT_A * angle + _LEFT_B
 
     def angle_to_servo_value_right_eye(self, angle):
         """
@@ -213,16 +790,9 @@ class ServoController:
 
         Note: Right eye servo is mechanically identical but mounted opposite
         """
-        # Clamp to physical range
-        angle = max(0, min(75, angle))
-
-        # Normalize to 0-1 (0° = 0, 75° = 1)
-        normalized = angle / 75.0
-
-        # Inverted left eye formula: -(0.100 - (normalized * 0.410))
-        servo_value = -0.100 + (normalized * 0.410)
-
-        return servo_value
+        # Clamp to physical range, then inverted left eye formula: -0.100 to 0.310
+        angle = 0 if angle < 0 else (_EYE_MAX if angle > _EYE_MAX else angle)
+        return _RIGHT_A * angle + _RIGHT_B
 
     def angle_to_servo_value_mouth(self, angle):
         """
@@ -235,16 +805,46 @@ class ServoController:
 
         Note: Mouth uses 0-60° range (smaller than eyes' 0-75°)
         """
-        # Clamp to physical range
-        angle = max(0, min(60, angle))
-
-        # Normalize to 0-1 (0° = 0, 60° = 1)
-        normalized = angle / 60.0
+        # Clamp to physical range, then map to calibrated servo range: 0.000 to -0.600
+        angle = 0 if angle < 0 else (_MOUTH_MAX if angle > _MOUTH_MAX else angle)
+        return _MOUTH_A * angle + _MOUTH_B
+
+    # Raw writers - no lock, no clamp, no attach; angle must already be in range
+    def _set_left_raw(self, angle):
+        """Write an already-clamped left eyelid angle straight to the servo"""
+        self.left_eyelid.value = _LEFT_A * angle + _LEFT_B
+        self.current_left = angle
+
+    def _set_right_raw(self, angle):
+        """Write an already-clamped right eyelid angle straight to the servo"""
+        self.right_eyelid.value = _RIGHT_A * angle + _RIGHT_B
+        self.current_right = angle
+
+    def _set_mouth_raw(self, angle):
+        """Write an already-clamped mouth angle straight to the servo"""
+        self.mouth.value = _MOUTH_A * angle + _MOUTH_B
+        self.current_mouth = angle
+
+    def _write_mouth_us(self, us):
+        """
+        Write a mouth pulse width straight to pigpiod (pigpio factory only)
 
-        # Map to calibrated servo range: 0.000 to -0.600
-        servo_value = 0.000 - (normalized * 0.600)
+        Bypasses gpiozero entirely - one call into the pigpio daemon. This puts
+        the pin in pigpio servo mode - or hardware-PWM mode on a hardware-PWM
+        pin, where the pulse comes from the PWM peripheral. gpiozero's .value
+        writes fail in either mode, so the caller must hand the pin back with
+        self.mouth.detach() when done (see _speech_animation_loop): its pigpio
+        write switches servo pulses / hardware PWM off.
 
-        return servo_value
+        Args:
+            us: Pulse width in microseconds (clamped to 500-2500)
+        """
+        us = 500 if us < 500 else (2500 if us > 2500 else us)
+        if self._mouth_hw_pwm:
+            # 50 Hz, duty in millionths of the 20 ms frame (1 µs = 50)
+            self._pi.hardware_PWM(self._mouth_pin, 50, int(us * 50 + 0.5))
+        else:
+            self._pi.set_servo_pulsewidth(self._mouth_pin, int(us + 0.5))
 
     # =========================================================================
     # SMOOTH MOVEMENT & EASING
@@ -252,86 +852,168 @@ class ServoController:
 
     @staticmethod
     def ease_in_out_cubic(t):
+        """Cubic easing (0 to 1) - see module-level ease_in_out_cubic"""
+        return ease_in_out_cubic(t)
+
+    @staticmethod
+    def ease_out_bounce(t):
+        """Bounce easing (0 to 1) - see module-level ease_out_bounce"""
+        return ease_out_bounce(t)
+
+    def _plan_transition(self, target_angle, current_angle, steps=15, easing='cubic'):
         """
-        Cubic easing function for smooth, natural movement
+        Compute the eased trajectory from current to target
 
         Args:
-            t: Progress from 0 to 1
+            target_angle: Target angle
+            current_angle: Current angle
+            steps: Maximum number of interpolation steps (fewer for short moves)
+            easing: 'cubic', 'bounce', or 'linear'
 
         Returns:
-            Eased value (0 to 1)
+            Tuple of up to steps + 1 interpolated values
         """
-        if t < 0.5:
-            return 4 * t * t * t
-        else:
-            p = 2 * t - 2
-            return 1 + p * p * p / 2
+        # No more steps than the move has distinguishable positions
+        steps = min(steps, max(1, int(abs(target_angle - current_angle) / _STEP_RES)))
 
-    @staticmethod
-    def ease_out_bounce(t):
+        # Whole trajectory in one vectorized multiply-add
+        table = _get_ease_table(easing, steps)
+        return tuple((current_angle + (target_angle - current_angle) * table).tolist())
+
+    def _smooth_transition(self, servo, trajectory, step_delay):
         """
-        Bounce easing for playful expressions
+        Play a precomputed trajectory on a servo and wait for it to finish
 
         Args:
-            t: Progress from 0 to 1
+            servo: Servo object to move
+            trajectory: Tuple of servo values from _plan_transition()
+            step_delay: Seconds between consecutive values
 
         Returns:
-            Eased value with bounce (0 to 1)
-        """
-        if t < 1 / 2.75:
-            return 7.5625 * t * t
-        elif t < 2 / 2.75:
-            t -= 1.5 / 2.75
-            return 7.5625 * t * t + 0.75
-        elif t < 2.5 / 2.75:
-            t -= 2.25 / 2.75
-            return 7.5625 * t * t + 0.9375
-        else:
-            t -= 2.625 / 2.75
-            return 7.5625 * t * t + 0.984375
+            Final value reached
+        """
+        if abs(trajectory[-1] - trajectory[0]) < _WRITE_TOL:  # Already there
+            return trajectory[-1]
+
+        # Hand the trajectory to the writer thread and wait for it to play out
+        self._writer.submit(servo, trajectory, step_delay).wait()
 
-    def _smooth_transition(self, servo, target_angle, current_angle,
-                          duration=0.3, steps=15, easing='cubic'):
+        return trajectory[-1]
+
+    def _move_parallel(self, moves, steps=15, easing='cubic'):
         """
-        Smoothly transition servo from current to target angle
+        Run several smooth transitions concurrently
+
+        All trajectories are queued on the writer thread at once, so
+        physically independent servos move together instead of one
+        after another.
 
         Args:
-            servo: Servo object to move
-            target_angle: Target angle
-            current_angle: Current angle
-            duration: Transition duration in seconds
-            steps: Number of interpolation steps
+            moves: List of (servo, target_value, current_value, duration[, delay]) tuples
+            steps: Number of interpolation steps per move
             easing: 'cubic', 'bounce', or 'linear'
+        """
+        pending = []
+        for servo, target_value, current_value, duration, *delay in moves:
+            values = self._plan_transition(target_value, current_value, steps, easing)
+            pending.append(self._writer.submit(servo, values, duration / (len(values) - 1), *delay))
 
-        Returns:
-            Final angle reached
+        for done in pending:
+            done.wait()
+
+    def set_frame(self, left=None, right=None, mouth=None, smooth=True, duration=0.2, steps=15):
         """
-        if abs(target_angle - current_angle) < 1:  # Already there
-            return target_angle
+        Move any combination of servos together as one keyframe
 
-        step_delay = duration / steps
+        All trajectories go to the writer thread at once, so the servos move
+        phase-locked instead of one set_* call after another. None leaves
+        that servo alone (not locked, attached or moved).
 
-        for i in range(steps + 1):
-            # Calculate progress (0 to 1)
-            progress = i / steps
+        Args:
+            left: Target left eyelid angle (0-75°) or None
+            right: Target right eyelid angle (0-75°) or None
+            mouth: Target mouth angle (0-60°) or None
+            smooth: Use smooth interpolation
+            duration: Transition duration if smooth
+            steps: Number of interpolation steps
+        """
+        if left is not None:
+            left = 0 if left < 0 else (_EYE_MAX if left > _EYE_MAX else left)
+        if right is not None:
+            right = 0 if right < 0 else (_EYE_MAX if right > _EYE_MAX else right)
+        if mouth is not None:
+            mouth = 0 if mouth < 0 else (_MOUTH_MAX if mouth > _MOUTH_MAX else mouth)
+            # During speech the animation loop owns the mouth (see set_mouth)
+            if self.speech_animation_active:
+                self._mouth_target = mouth
+                mouth = None
+
+        # Always acquired in left → right → mouth order (no lock-order deadlock)
+        locks = [lock for lock, target in ((self._left_lock, left), (self._right_lock, right),
+                                           (self._mouth_lock, mouth)) if target is not None]
+        if not locks:
+            return
+        for lock in locks:
+            lock.acquire()
+        try:
+            self._attach_servos(left=left is not None, right=right is not None,
+                                mouth=mouth is not None)
 
-            # Apply easing
-            if easing == 'cubic':
-                eased_progress = self.ease_in_out_cubic(progress)
-            elif easing == 'bounce':
-                eased_progress = self.ease_out_bounce(progress)
-            else:  # linear
-                eased_progress = progress
+            if smooth:
+                # Lazy eye: right trajectory starts slightly after the left one
+                right_delay = self.lazy_eye_delay if self.lazy_eye_enabled else 0.0
+                moves = []
+                if left is not None:
+                    moves.append((self.left_eyelid,
+                                  self.angle_to_servo_value_left_eye(left),
+                                  self.angle_to_servo_value_left_eye(self.current_left),
+                                  duration))
+                if right is not None:
+                    moves.append((self.right_eyelid,
+                                  self.angle_to_servo_value_right_eye(right),
+                                  self.angle_to_servo_value_right_eye(self.current_right),
+                                  duration, right_delay))
+                if mouth is not None:
+                    moves.append((self.mouth,
+                                  self.angle_to_servo_value_mouth(mouth),
+                                  self.angle_to_servo_value_mouth(self.current_mouth),
+                                  duration))
+                self._move_parallel(moves, steps=steps)
+
+                if left is not None:
+                    self.current_left = left
+                if right is not None:
+                    self.current_right = right
+                if mouth is not None:
+                    self.current_mouth = mouth
+            else:
+                # Instant - angles already clamped
+                if left is not None:
+                    self._set_left_raw(left)
+                if right is not None:
+                    self._set_right_raw(right)
+                if mouth is not None:
+                    self._set_mouth_raw(mouth)
 
-            # Interpolate angle
-            angle = current_angle + (target_angle - current_angle) * eased_progress
+            self._schedule_detach()
+        finally:
+            for lock in reversed(locks):
+                lock.release()
 
-            # Apply to servo
-            servo.value = angle
+    def set_eyelids(self, left_angle, right_angle, smooth=True, duration=0.25):
+        """
+        Set both eyelid angles together (0=closed, 75=wide open)
 
-            time.sleep(step_delay)
+        Smooth moves run both trajectories at once instead of left-then-right,
+        so a bilateral move takes `duration`, not twice that.
 
-        return target_angle
+        Args:
+            left_angle: Target left eyelid angle (0-75°)
+            right_angle: Target right eyelid angle (0-75°)
+            smooth: Use smooth interpolation
+            duration: Transition duration if smooth
+        """
+        self.set_frame(left_angle, right_angle, smooth=smooth, duration=duration)
 
     def set_left_eyelid(self, angle, smooth=True, duration=0.25):
         """
@@ -346,26 +1028,23 @@ class ServoController:
             duration: Transition duration if smooth
         """
         # Clamp to calibrated physical range (0-75°)
-        angle = max(0, min(75, angle))
+        angle = 0 if angle < 0 else (_EYE_MAX if angle > _EYE_MAX else angle)
 
-        with self.movement_lock:
+        with self._left_lock:
             # Re-attach servos before movement (jitter reduction)
-            self._attach_servos()
+            self._attach_servos(right=False, mouth=False)
 
             if smooth:
-                # Use CALIBRATED mapping
-                current_value = self.angle_to_servo_value_left_eye(self.current_left)
-                target_value = self.angle_to_servo_value_left_eye(angle)
+                # Use CALIBRATED mapping, planned once as a flat trajectory
+                trajectory = self._plan_transition(self.angle_to_servo_value_left_eye(angle),
+                                                   self.angle_to_servo_value_left_eye(self.current_left))
 
                 # Smooth transition
-                self._smooth_transition(self.left_eyelid, target_value,
-                                       current_value, duration)
+                self._smooth_transition(self.left_eyelid, trajectory, duration / (len(trajectory) - 1))
+                self.current_left = angle
             else:
-                # Instant - use CALIBRATED mapping
-                value = self.angle_to_servo_value_left_eye(angle)
-                self.left_eyelid.value = value
-
-            self.current_left = angle
+                # Instant - angle already clamped
+                self._set_left_raw(angle)
 
             # Schedule detach after idle period (jitter reduction)
             self._schedule_detach()
@@ -383,30 +1062,27 @@ class ServoController:
             duration: Transition duration if smooth
         """
         # Clamp to calibrated physical range (0-75°)
-        angle = max(0, min(75, angle))
+        angle = 0 if angle < 0 else (_EYE_MAX if angle > _EYE_MAX else angle)
 
         # Lazy eye delay if enabled
         if self.lazy_eye_enabled and smooth:
             time.sleep(self.lazy_eye_delay)
 
-        with self.movement_lock:
+        with self._right_lock:
             # Re-attach servos before movement (jitter reduction)
-            self._attach_servos()
+            self._attach_servos(left=False, mouth=False)
 
             if smooth:
-                # Use CALIBRATED mapping
-                current_value = self.angle_to_servo_value_right_eye(self.current_right)
-                target_value = self.angle_to_servo_value_right_eye(angle)
+                # Use CALIBRATED mapping, planned once as a flat trajectory
+                trajectory = self._plan_transition(self.angle_to_servo_value_right_eye(angle),
+                                                   self.angle_to_servo_value_right_eye(self.current_right))
 
                 # Smooth transition
-                self._smooth_transition(self.right_eyelid, target_value,
-                                       current_value, duration)
+                self._smooth_transition(self.right_eyelid, trajectory, duration / (len(trajectory) - 1))
+                self.current_right = angle
             else:
-                # Instant - use CALIBRATED mapping
-                value = self.angle_to_servo_value_right_eye(angle)
-                self.right_eyelid.value = value
-
-            self.current_right = angle
+                # Instant - angle already clamped
+                self._set_right_raw(angle)
 
             # Schedule detach after idle period (jitter reduction)
             self._schedule_detach()
@@ -424,33 +1100,32 @@ class ServoController:
             duration: Transition duration if smooth
         """
         # Clamp to calibrated physical range (0-60°)
-        angle = max(0, min(60, angle))
+        angle = 0 if angle < 0 else (_MOUTH_MAX if angle > _MOUTH_MAX else angle)
 
-        with self.movement_lock:
-            # Re-attach servos before movement (jitter reduction)
-            # BUT during speech animation, mouth is already attached and eyes should stay detached
-            if not self.speech_animation_active:
-                self._attach_servos()
+        # During speech the animation loop is the only mouth writer - hand it
+        # the angle instead of fighting it for the servo
+        if self.speech_animation_active:
+            self._mouth_target = angle
+            return
+
+        with self._mouth_lock:
+            # Re-attach the mouth before movement (jitter reduction)
+            self._attach_servos(left=False, right=False)
 
             if smooth:
-                # Use CALIBRATED mapping
-                current_value = self.angle_to_servo_value_mouth(self.current_mouth)
-                target_value = self.angle_to_servo_value_mouth(angle)
+                # Use CALIBRATED mapping, planned once as a flat trajectory
+                trajectory = self._plan_transition(self.angle_to_servo_value_mouth(angle),
+                                                   self.angle_to_servo_value_mouth(self.current_mouth))
 
                 # Smooth transition
-                self._smooth_transition(self.mouth, target_value,
-                                       current_value, duration)
+                self._smooth_transition(self.mouth, trajectory, duration / (len(trajectory) - 1))
+                self.current_mouth = angle
             else:
-                # Instant - use CALIBRATED mapping
-                value = self.angle_to_servo_value_mouth(angle)
-                self.mouth.value = value
-
-            self.current_mouth = angle
+                # Instant - angle already clamped
+                self._set_mouth_raw(angle)
 
             # Schedule detach after idle period (jitter reduction)
-            # BUT not during speech animation - mouth needs to stay active!
-            if not self.speech_animation_active:
-                self._schedule_detach()
+            self._schedule_detach()
 
     # =========================================================================
     # PERSONALITY METHODS - TARS Character
@@ -468,64 +1143,38 @@ class ServoController:
         if duration is None:
             base_duration = 0.12
             if natural_variation:
-                duration = base_duration * (1 + random.uniform(-self.blink_variation,
-                                                               self.blink_variation))
+                duration = base_duration * self._blink_jitter[self._blink_jitter_i & 63]
+                self._blink_jitter_i += 1
             else:
                 duration = base_duration
 
-        # Store current positions
-        left_current = self.current_left
-        right_current = self.current_right
-
-        # Re-attach servos for movement
-        self._attach_servos()
-
-        # CLOSE PHASE (fast) - BOTH EYES SIMULTANEOUSLY
-        close_duration = duration * 0.4
-        steps = 10
-        step_delay = close_duration / steps
-
-        for i in range(steps + 1):
-            progress = i / steps
-            eased = self.ease_in_out_cubic(progress)
-
-            # Move BOTH eyes at the same time
-            left_angle = left_current + (0 - left_current) * eased
-            right_angle = right_current + (0 - right_current) * eased
-
-            self.left_eyelid.value = self.angle_to_servo_value_left_eye(left_angle)
-            self.right_eyelid.value = self.angle_to_servo_value_right_eye(right_angle)
-
-            if i < steps:
-                time.sleep(step_delay)
+        # Close 0.4 (fast), pause 0.2, open 0.6 (slower) of duration as one
+        # keyframe curve at duration / 30 per frame
+        profile = _get_lid_profile(12, 6, 18)
+        tick = duration / 30
 
-        self.current_left = 0
-        self.current_right = 0
+        # Lazy eye: right lid runs slightly behind the left one
+        right_delay = self.lazy_eye_delay if self.lazy_eye_enabled else 0.0
 
-        # Brief pause
-        time.sleep(duration * 0.2)
+        with self._left_lock, self._right_lock:
+            left_open = self.angle_to_servo_value_left_eye(self.current_left)
+            right_open = self.angle_to_servo_value_right_eye(self.current_right)
+            left_span = self.angle_to_servo_value_left_eye(0) - left_open
+            right_span = self.angle_to_servo_value_right_eye(0) - right_open
 
-        # OPEN PHASE (slower) - BOTH EYES SIMULTANEOUSLY
-        open_duration = duration * 0.6
-        steps = 12
-        step_delay = open_duration / steps
+            self._attach_servos(mouth=False)
 
-        for i in range(steps + 1):
-            progress = i / steps
-            eased = self.ease_in_out_cubic(progress)
-
-            # Move BOTH eyes at the same time
-            left_angle = 0 + (left_current - 0) * eased
-            right_angle = 0 + (right_current - 0) * eased
-
-            self.left_eyelid.value = self.angle_to_servo_value_left_eye(left_angle)
-            self.right_eyelid.value = self.angle_to_servo_value_right_eye(right_angle)
+            # Whole blink queued as one trajectory per eye - BOTH EYES SIMULTANEOUSLY
+            pending = (
+                self._writer.submit(self.left_eyelid,
+                                    (left_open + left_span * profile).tolist(), tick),
+                self._writer.submit(self.right_eyelid,
+                                    (right_open + right_span * profile).tolist(), tick, right_delay),
+            )
+            for done in pending:
+                done.wait()
 
-            if i < steps:
-                time.sleep(step_delay)
-
-        self.current_left = left_current
-        self.current_right = right_current
+            self._schedule_detach()
 
     def test_sync_movement(self):
         """
@@ -620,18 +1269,22 @@ class ServoController:
             eye: 'left' or 'right'
             duration: Wink duration
         """
+        # Close 0.4, hold 0.4, reopen 0.6 of duration as one keyframe curve
+        profile = _get_lid_profile(12, 12, 18)
         if eye == 'left':
-            current = self.current_left
-            self.set_left_eyelid(0, smooth=True, duration=duration * 0.4)
-            time.sleep(duration * 0.4)
-            self.set_left_eyelid(current, smooth=True, duration=duration * 0.6)
+            lock, servo, to_value = self._left_lock, self.left_eyelid, self.angle_to_servo_value_left_eye
         else:  # right
-            current = self.current_right
-            self.set_right_eyelid(0, smooth=True, duration=duration * 0.4)
-            time.sleep(duration * 0.4)
-            self.set_right_eyelid(current, smooth=True, duration=duration * 0.6)
+            lock, servo, to_value = self._right_lock, self.right_eyelid, self.angle_to_servo_value_right_eye
+
+        with lock:
+            current = self.current_left if eye == 'left' else self.current_right
+            start = to_value(current)
+            self._attach_servos(left=eye == 'left', right=eye != 'left', mouth=False)
+            self._writer.submit(servo, (start + (to_value(0) - start) * profile).tolist(),
+                                duration / 30).wait()
+            self._schedule_detach()
 
-        logger.debug(f"Winked {eye} eye")
+        logger.debug("Winked {} eye", eye)
 
     def eyebrow_raise(self, side='both', height=15):
         """
@@ -641,36 +1294,34 @@ class ServoController:
             side: 'left', 'right', or 'both'
             height: Additional degrees to open
         """
-        if side in ['left', 'both']:
-            target = min(90, self.current_left + height)
-            self.set_left_eyelid(target, smooth=True, duration=0.2)
+        # set_frame clamps to the physical range, no pre-clamp needed
+        if side == 'both':
+            self.set_frame(self.current_left + height, self.current_right + height, duration=0.2)
+        elif side == 'left':
+            self.set_frame(left=self.current_left + height, duration=0.2)
+        elif side == 'right':
+            self.set_frame(right=self.current_right + height, duration=0.2)
 
-        if side in ['right', 'both']:
-            target = min(90, self.current_right + height)
-            self.set_right_eyelid(target, smooth=True, duration=0.2)
-
-        logger.debug(f"Eyebrow raise: {side}")
+        logger.debug("Eyebrow raise: {}", side)
 
     def double_take(self):
         """
         Quick look away and back (surprise reaction)
         """
-        left_current = self.current_left
-        right_current = self.current_right
+        with self._left_lock, self._right_lock:
+            left_current = self.current_left
+            right_current = self.current_right
 
-        # Look away (narrow eyes)
-        self.set_left_eyelid(max(0, left_current - 20), smooth=True, duration=0.15)
-        self.set_right_eyelid(max(0, right_current - 20), smooth=True, duration=0.15)
-        time.sleep(0.1)
+            # Look away (narrow eyes)
+            self.set_frame(left_current - 20, right_current - 20, duration=0.15)
+            time.sleep(0.1)
 
-        # Snap back (wide)
-        self.set_left_eyelid(min(90, left_current + 10), smooth=True, duration=0.1)
-        self.set_right_eyelid(min(90, right_current + 10), smooth=True, duration=0.1)
-        time.sleep(0.15)
+            # Snap back (wide)
+            self.set_frame(left_current + 10, right_current + 10, duration=0.1)
+            time.sleep(0.15)
 
-        # Return to normal
-        self.set_left_eyelid(left_current, smooth=True, duration=0.2)
-        self.set_right_eyelid(right_current, smooth=True, duration=0.2)
+            # Return to normal
+            self.set_frame(left_current, right_current, duration=0.2)
 
         logger.debug("Double take reaction")
 
@@ -682,36 +1333,39 @@ class ServoController:
             expression_type: 'surprise', 'disapproval', 'interest', 'skeptical'
             duration: How long to hold micro-expression
         """
-        # Store current state
-        left_current = self.current_left
-        right_current = self.current_right
-        mouth_current = self.current_mouth
-
-        # Apply micro-expression
-        if expression_type == 'surprise':
-            self.set_left_eyelid(min(90, left_current + 15), smooth=False)
-            self.set_right_eyelid(min(90, right_current + 15), smooth=False)
-            self.set_mouth(min(60, mouth_current + 10), smooth=False)
-        elif expression_type == 'disapproval':
-            self.set_left_eyelid(max(0, left_current - 10), smooth=False)
-            self.set_right_eyelid(left_current, smooth=False)  # Asymmetric
-            self.set_mouth(max(0, mouth_current - 3), smooth=False)
-        elif expression_type == 'interest':
-            self.set_left_eyelid(min(90, left_current + 8), smooth=False)
-            self.set_right_eyelid(min(90, right_current + 12), smooth=False)  # Asymmetric
-        elif expression_type == 'skeptical':
-            self.set_left_eyelid(max(0, left_current - 5), smooth=False)
-            self.set_right_eyelid(max(0, right_current - 5), smooth=False)
-            self.set_mouth(max(0, mouth_current - 2), smooth=False)
-
-        time.sleep(duration)
-
-        # Return to previous
-        self.set_left_eyelid(left_current, smooth=True, duration=0.2)
-        self.set_right_eyelid(right_current, smooth=True, duration=0.2)
-        self.set_mouth(mouth_current, smooth=True, duration=0.2)
-
-        logger.debug(f"Micro-expression: {expression_type}")
+        with self._left_lock, self._right_lock, self._mouth_lock:
+            # Store current state
+            left_current = self.current_left
+            right_current = self.current_right
+            mouth_current = self.current_mouth
+
+            # Flash the micro-expression as one instant frame (set_frame clamps)
+            if expression_type == 'surprise':
+                self.set_frame(left_current + 15, right_current + 15, mouth_current + 10, smooth=False)
+            elif expression_type == 'disapproval':
+                self.set_frame(left_current - 10, left_current, mouth_current - 3, smooth=False)  # Asymmetric
+            elif expression_type == 'interest':
+                self.set_frame(left_current + 8, right_current + 12, smooth=False)  # Asymmetric
+            elif expression_type == 'skeptical':
+                self.set_frame(left_current - 5, right_current - 5, mouth_current - 2, smooth=False)
+
+            time.sleep(duration)
+
+            # Return to previous - all three servos together
+            self.set_frame(left_current, right_current, mouth_current, duration=0.2)
+
+        logger.debug("Micro-expression: {}", expression_type)
+
+    def reload_expressions(self):
+        """
+        (Re)load expression definitions from config/expressions.yaml
+
+        Loaded once at startup by _load_config(); call this after editing
+        the file at runtime. A failed load keeps the previous expressions.
+        """
+        expressions = self._load_expressions()
+        if expressions is not None:
+            self.config = replace(self.config, expressions=expressions)
 
     def set_expression(self, expression_name):
         """
@@ -719,30 +1373,16 @@ class ServoController:
 
         Expressions defined in config/expressions.yaml
         """
-        expr_config = self.config.get('expressions', {})
-
-        # Load expression definitions
-        expr_path = Path(__file__).parent.parent / 'config' / 'expressions.yaml'
-        with open(expr_path, 'r') as f:
-            expressions = yaml.safe_load(f)
-
-        if expression_name not in expressions['expressions']:
+        expr = self.config.expressions.get(expression_name)
+        if expr is None:
             logger.warning(f"Unknown expression: {expression_name}")
             return
 
-        expr = expressions['expressions'][expression_name]
         eyelids = expr.get('eyelids', {})
         mouth = expr.get('mouth', {})
 
-        # Set eyelids
-        if 'left' in eyelids:
-            self.set_left_eyelid(eyelids['left'])
-        if 'right' in eyelids:
-            self.set_right_eyelid(eyelids['right'])
-
-        # Set mouth
-        if 'angle' in mouth:
-            self.set_mouth(mouth['angle'])
+        # Eyelids and mouth move together as one frame
+        self.set_frame(eyelids.get('left'), eyelids.get('right'), mouth.get('angle'), duration=0.25)
 
         logger.info(f"Expression set: {expression_name}")
 
@@ -760,11 +1400,11 @@ class ServoController:
             logger.debug("Speech animation already active")
             return
 
-        # Cancel any pending detach timer (from previous set_expression, etc.)
+        # Cancel any pending detach (from previous set_expression, etc.)
         # We don't want servos detaching during speech!
-        if self._detach_timer:
-            self._detach_timer.cancel()
-            logger.debug("Cancelled pending detach timer before speech animation")
+        if self._detach_deadline is not None:
+            self.cancel_detach()
+            logger.debug("Cancelled pending detach before speech animation")
 
         # Ensure all servos are attached for natural animation
         # Set mouth to neutral position using .value (which attaches the servo)
@@ -779,13 +1419,12 @@ class ServoController:
         except Exception as e:
             logger.error(f"Failed to attach servos for speech animation: {e}")
 
+        self._mouth_target = None
         self.speech_animation_active = True
-        self._speech_animation_thread = threading.Thread(
-            target=self._speech_animation_loop,
-            args=(base_amplitude, max_angle_override),
-            daemon=True
-        )
-        self._speech_animation_thread.start()
+        self._speech_stop.clear()
+        self._speech_done.clear()
+        self._speech_params = (base_amplitude, max_angle_override)
+        self._speech_start.set()  # Wake the parked animator thread
         logger.debug(f"Speech animation started (amplitude={base_amplitude}, max_angle={max_angle_override or 'default'})")
 
     def stop_speech_animation(self):
@@ -794,15 +1433,46 @@ class ServoController:
             return
 
         self.speech_animation_active = False
+        self._speech_stop.set()  # Wakes the loop immediately instead of after its frame sleep
+        self._writer.cancel(self.mouth)  # Drop any mouth moves still queued
 
-        # Wait for thread to finish
-        if self._speech_animation_thread:
-            self._speech_animation_thread.join(timeout=1.0)
+        # Wait for the animator to leave the loop (it stays alive, parked)
+        self._speech_done.wait(timeout=1.0)
+        self._mouth_target = None  # Mouth ownership back to set_mouth
 
         # Return mouth to neutral
         self.set_mouth(self.mouth_config['neutral_angle'], smooth=True, duration=0.3)
         logger.debug("Speech animation stopped")
 
+    def _speech_animator(self):
+        """Animator thread body - runs one speech loop per start_speech_animation()"""
+        # Real-time priority for this thread only, so ASR/TTS/camera work
+        # doesn't delay mouth frames (needs CAP_SYS_NICE, else stays SCHED_OTHER)
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            logger.debug("Speech animator running SCHED_FIFO")
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Speech animator keeps normal scheduling: {e}")
+
+        while True:
+            self._speech_start.wait()
+            self._speech_start.clear()
+            params = self._speech_params
+            if params is None:  # Shut down
+                return
+            try:
+                self._speech_animation_loop(*params)
+            except Exception as e:
+                logger.error(f"Speech animation loop failed: {e}")
+            finally:
+                self._speech_done.set()
+
+    def _shutdown_speech_animator(self):
+        """Stop any running loop and let the animator thread exit"""
+        self._speech_stop.set()
+        self._speech_params = None
+        self._speech_start.set()
+
     def _speech_animation_loop(self, base_amplitude: float, max_angle_override: int = None):
         """
         Animate mouth during speech with natural talking motion
@@ -818,41 +1488,107 @@ class ServoController:
         # Calculate movement range based on calibrated values (use full range, no int truncation)
         mouth_range = (max_open - neutral) * base_amplitude
 
+        # pigpio: write pulse widths directly (Servo value v → 1500 + 1000*v µs
+        # for the 0.5-2.5ms pulse range set in __init__)
+        direct = self._pi is not None
+        us_base = 1500 + 1000 * _MOUTH_B
+        us_per_deg = 1000 * _MOUTH_A
+
         frame = 0
+        last_pos = None
+        debug = _debug_enabled()
+        frames = self._render_speech_frames(neutral, max_open, mouth_range)
+        period = 0.033  # ~30 FPS for smoother, more responsive animation
+        next_t = time.monotonic()
         logger.info(f"💬 Animation loop started (range: {neutral}° to {max_open}°, amplitude: {base_amplitude})")
-        while self.speech_animation_active:
-            # Create natural talking motion using FAST sine waves that match speech cadence
-            # Much higher frequencies for realistic speech animation (8-12 Hz typical speech)
-            primary_wave = math.sin(frame * 1.2)  # ~6 Hz at 30 FPS - fast talking motion
-            secondary_wave = math.sin(frame * 0.8) * 0.3  # ~4 Hz variation
-            noise = random.uniform(-0.15, 0.15)  # More variation for natural look
-
-            # Combine waves - use FULL 0-1 range (not * 0.5!)
-            combined = (primary_wave + secondary_wave + noise)  # -1 to 1 range
-            combined = (combined + 1.0) / 2.0  # Normalize to 0-1 (using full range)
-            combined = max(0.0, min(1.0, combined))  # Clamp
-
-            # Calculate mouth position (keep as float for smooth movement)
-            mouth_pos = neutral + (mouth_range * combined)
-            mouth_pos = int(max(neutral, min(max_open, mouth_pos)))  # Clamp and convert to int
-
-            # Debug every 10th frame
-            if frame % 10 == 0:
-                logger.debug(f"Animation frame {frame}: pos={mouth_pos}°, combined={combined:.2f}")
-
-            # Set mouth position (fast, no smoothing for responsive animation)
-            with self.movement_lock:
-                self.set_mouth(mouth_pos, smooth=False)
+        while not self._speech_stop.is_set():
+            # Pre-rendered talking motion - re-render with fresh noise on wrap
+            # so long utterances don't visibly repeat
+            i = frame % _SPEECH_WAVE_LEN
+            if i == 0 and frame:
+                frames = self._render_speech_frames(neutral, max_open, mouth_range)
+            mouth_pos = frames[i]
+            target = self._mouth_target  # set_mouth() hand-off while speaking
+            if target is not None and mouth_pos < target:
+                mouth_pos = target if target < max_open else max_open
+
+            # Debug every 10th frame (skips the f-string entirely when off)
+            if debug and frame % 10 == 0:
+                logger.debug(f"Animation frame {frame}: pos={mouth_pos:.1f}°")
+
+            # Set mouth position directly (fast, no smoothing for responsive animation)
+            # This loop is the only mouth writer while speaking (set_mouth hands
+            # off via _mouth_target) and mouth_pos is already clamped, so no
+            # lock/clamp/attach work is needed
+            # mouth_pos is quantized to 0.1° and can repeat - only write when it changes
+            if mouth_pos != last_pos:
+                try:
+                    if direct:
+                        self._write_mouth_us(us_base + us_per_deg * mouth_pos)
+                    else:
+                        self._set_mouth_raw(mouth_pos)
+                    last_pos = mouth_pos
+                except Exception as e:
+                    logger.debug(f"Mouth write failed: {e}")
 
             frame += 1
-            time.sleep(0.033)  # ~30 FPS for smoother, more responsive animation
+
+            # Fixed-rate: sleep to the next absolute deadline, skip ahead if we overran
+            next_t += period
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                if self._speech_stop.wait(delay):
+                    break
+            else:
+                next_t = time.monotonic()
+
+        if direct and last_pos is not None:
+            self.current_mouth = last_pos
+            # Hand the pin back to gpiozero: detach() drives it low, which takes it
+            # out of pigpio's servo or hardware-PWM mode, and the next .value write
+            # (set_mouth in stop_speech_animation) sets up gpiozero's PWM on it again
+            try:
+                self.mouth.detach()
+            except Exception as e:
+                logger.warning(f"Mouth release after speech failed: {e}")
 
         logger.info(f"💬 Animation loop stopped (total frames: {frame})")
 
+    def _render_speech_frames(self, neutral, max_open, mouth_range):
+        """
+        Pre-render mouth positions for one speech wavetable period
+
+        Args:
+            neutral: Mouth neutral angle
+            max_open: Maximum mouth angle for this utterance
+            mouth_range: Angle span scaled by amplitude
+
+        Returns:
+            List of float mouth angles (0.1° steps), one per animation frame
+        """
+        # Natural talking motion using FAST sine waves that match speech cadence
+        # (8-12 Hz typical speech), random phase + noise so every utterance differs
+        rng = _SPEECH_RNG
+        wave = np.roll(_SPEECH_WAVE, -int(rng.integers(_SPEECH_WAVE_LEN)))
+        noise = rng.random(_SPEECH_WAVE_LEN, dtype=np.float32)  # More variation for natural look
+        noise *= 0.3
+        noise -= 0.15  # -0.15..0.15
+
+        # Combine waves - use FULL 0-1 range (not * 0.5!), then clamp
+        combined = np.clip((wave + noise + 1.0) * 0.5, 0.0, 1.0)
+
+        # Mouth position, clamped to neutral..max_open. Kept fractional - whole
+        # degrees would leave only ~60 distinct pulses; 0.1° is one pigpio µs
+        mouth_pos = np.maximum(np.minimum(neutral + mouth_range * combined, max_open), neutral)
+        return np.round(mouth_pos, 1).tolist()
+
     def cleanup(self):
         """Clean up GPIO resources"""
         # Stop any active animations
         self.stop_speech_animation()
+        self._shutdown_speech_animator()
+        self._watchdog_stop.set()
+        self._writer.stop()
 
         self.left_eyelid.close()
         self.right_eyelid.close()
@@ -7,13 +7,42 @@ Gary strips markers from text and sends: {"response": "text", "emotion": "X", "a
 """
 
 import asyncio
+import math
 import time
+import threading
+from collections import Counter, deque
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Callable, Awaitable
 from loguru import logger
 import sounddevice as sd
 import soundfile as sf
+from scipy.signal import resample_poly  # System package (see requirements.txt)
+
+# Playback volume used unless a caller asks otherwise - buffers at this
+# volume are scaled once at load time
+DEFAULT_VOLUME = 0.7
+
+# Extra (sound, volume) buffers kept for non-default volumes
+_SCALED_CACHE_SIZE = 8
+
+# Effect output stream block size (frames per callback)
+_STREAM_BLOCKSIZE = 256
+
+
+def _scale_pcm(audio: np.ndarray, volume: float) -> np.ndarray:
+    """
+    Scale int16 PCM by a volume (8.8 fixed point, integer math only)
+
+    Args:
+        audio: int16 samples
+        volume: Playback volume 0.0-1.0
+
+    Returns:
+        New contiguous int16 buffer
+    """
+    gain = int(round(volume * 256))
+    return ((audio.astype(np.int32) * gain) >> 8).astype(np.int16)
 
 
 class StageActionHandler:
@@ -35,37 +64,77 @@ class StageActionHandler:
         self.servo_controller = servo_controller
         self.expression_engine = expression_engine
 
-        # Sound effects cache {action_name: (audio_data, sample_rate)}
-        self.sound_cache: Dict[str, Tuple[np.ndarray, int]] = {}
+        # Sound effects cache {action_name: (audio_data, audio_at_default_volume, sample_rate)}
+        self.sound_cache: Dict[str, Tuple[np.ndarray, np.ndarray, int]] = {}
+        # Pre-scaled buffers for other volumes {(action_name, volume): audio}
+        self._scaled_cache: Dict[Tuple[str, float], np.ndarray] = {}
+
+        # Effect output stream, opened on first playback and kept open across
+        # action batches - unless the device is exclusive (ALSA hw:/plughw:, no
+        # dmix), where it's closed after each batch so TTS can open the device.
+        # Every cached effect shares stream_rate; the callback drains _queue
+        self.stream_rate: Optional[int] = None
+        self._stream: Optional[sd.OutputStream] = None
+        self._exclusive_device = True  # Set when the stream opens
+        self._queue: deque = deque()  # Buffers waiting to play, head is playing
+        self._queue_pos = 0  # Frames of the head buffer already played
+        self._queue_lock = threading.Lock()
+        self._queued_until = 0.0  # time.monotonic() when the queue runs dry
 
         # Load sound effects
         self._load_sound_effects()
 
+        # Action name → handler(params), aliases resolved here once
+        self._action_table = self._build_action_table()
+
         logger.info(f"StageActionHandler initialized (sounds: {self.sounds_dir})")
 
     def _load_sound_effects(self):
         """Load all available sound effect files into cache"""
         sound_files = list(self.sounds_dir.glob('*.wav')) + list(self.sounds_dir.glob('*.mp3'))
 
+        loaded = []
         for sound_file in sound_files:
             try:
-                audio_data, sample_rate = sf.read(str(sound_file))
-                # Convert to mono if stereo
-                if len(audio_data.shape) > 1:
-                    audio_data = np.mean(audio_data, axis=1)
-
-                # Normalize to prevent clipping
-                audio_data = audio_data.astype(np.float32)
-                if np.max(np.abs(audio_data)) > 0:
-                    audio_data = audio_data / np.max(np.abs(audio_data)) * 0.8
-
-                # Cache by marker name (filename without extension)
-                marker_name = sound_file.stem
-                self.sound_cache[marker_name] = (audio_data, sample_rate)
-                logger.debug(f"Loaded sound effect: {marker_name} ({len(audio_data)} samples, {sample_rate}Hz)")
+                # float32 straight from libsndfile (1-D for mono files)
+                audio_data, sample_rate = sf.read(str(sound_file), dtype='float32', always_2d=False)
+                # Convert to mono if stereo (single-precision mixdown)
+                if audio_data.ndim > 1:
+                    audio_data = audio_data.mean(axis=1, dtype=np.float32)
+                loaded.append((sound_file.stem, audio_data, sample_rate))
             except Exception as e:
                 logger.warning(f"Failed to load sound effect {sound_file}: {e}")
 
+        if not loaded:
+            logger.info("Loaded 0 sound effects")
+            return
+
+        # One shared stream rate (the most common one) - the rest are
+        # resampled once here rather than reopening the stream per effect
+        self.stream_rate = Counter(rate for _, _, rate in loaded).most_common(1)[0][0]
+
+        for marker_name, audio_data, sample_rate in loaded:
+            if sample_rate != self.stream_rate:
+                g = math.gcd(self.stream_rate, sample_rate)
+                audio_data = resample_poly(audio_data, self.stream_rate // g,
+                                           sample_rate // g).astype(np.float32, copy=False)
+
+            # Normalize to prevent clipping (peak found once, scaled in place)
+            peak = float(np.max(np.abs(audio_data)))
+            if peak > 0:
+                audio_data *= np.float32(0.8 / peak)
+
+            # Cached as 16-bit PCM (half the memory of float32) - the stream
+            # plays int16 directly
+            audio_data = (audio_data * 32767.0).astype(np.int16)
+
+            # Cache by marker name (filename without extension), with the
+            # default-volume buffer ready to hand straight to the stream
+            scaled = _scale_pcm(audio_data, DEFAULT_VOLUME)
+            self.sound_cache[marker_name] = (audio_data, scaled, self.stream_rate)
+            logger.debug(f"Loaded sound effect: {marker_name} ({len(audio_data)} samples, "
+                         f"{sample_rate}Hz → {self.stream_rate}Hz)")
+
         logger.info(f"Loaded {len(self.sound_cache)} sound effects")
 
     async def process_actions_metadata(self, actions: List[Any]) -> None:
@@ -96,6 +165,11 @@ class StageActionHandler:
             except Exception as e:
                 logger.error(f"Failed to execute action {action}: {e}")
 
+        # TTS speaks on its own output stream - an exclusive device can't be
+        # opened by it while ours is open, so release it there
+        if self._exclusive_device:
+            self.close()
+
     async def execute_action(self, action: str, params: Optional[Dict] = None) -> bool:
         """
         Execute a single action (wink, blink, pause, sound effect, LED pattern)
@@ -118,35 +192,51 @@ class StageActionHandler:
         action = action.lower().strip()
         logger.debug(f"Executing action: {action} (params: {params})")
 
+        handler = self._action_table.get(action)
+        if handler is None:
+            logger.warning(f"Unknown action: {action}")
+            return False
+        return await handler(params)
+
+    def _build_action_table(self) -> Dict[str, Callable[[Dict], Awaitable[bool]]]:
+        """
+        Build the action dispatch table
+
+        Every alias maps straight to its handler with the canonical name
+        already bound (sighs → sigh), so execute_action is a single lookup.
+
+        Returns:
+            Dict of action name → async handler taking the params dict
+        """
+        table = {}
+
+        def add(names, handler):
+            for name in names:
+                table[name] = handler
+
         # === QUICK WIN #1: Winks & Blinks (5 minutes) ===
-        if action in ['wink', 'winks']:
-            return await self._action_wink()
-        elif action in ['blink', 'blinks']:
-            return await self._action_blink()
+        add(['wink', 'winks'], lambda p: self._action_wink())
+        add(['blink', 'blinks'], lambda p: self._action_blink())
 
         # === QUICK WIN #2: Chuckle/LED patterns (30 minutes) ===
-        elif action in ['chuckle', 'chuckles', 'excited', 'eyes_light_up']:
-            return await self._action_led_pattern(action)
+        add(['chuckle', 'chuckles'], lambda p: self._action_led_pattern('chuckle'))
+        add(['excited'], lambda p: self._action_led_pattern('excited'))
+        add(['eyes_light_up'], lambda p: self._action_led_pattern('eyes_light_up'))
 
         # === QUICK WIN #3: Pauses (1 hour) ===
-        elif action in ['pause', 'dramatic_pause', 'brief_pause']:
-            duration = params.get('value', params.get('duration', 500))
-            return await self._action_pause(int(duration))
+        add(['pause', 'dramatic_pause', 'brief_pause'],
+            lambda p: self._action_pause(int(p.get('value', p.get('duration', 500)))))
 
         # === QUICK WIN #4: Sound effects (30 minutes) ===
-        elif action in ['sigh', 'sighs', 'gasp', 'gasps', 'laugh', 'laughs',
-                       'breath', 'groan', 'groans', 'yawn', 'yawns', 'snicker', 'snickers']:
-            return self._action_sound_effect(action)
+        for sound in ['sigh', 'gasp', 'laugh', 'groan', 'yawn', 'snicker']:
+            add([sound, sound + 's'], lambda p, sound=sound: self._action_sound_effect(sound))
+        add(['breath'], lambda p: self._action_sound_effect('breath'))
 
         # === Other physical actions ===
-        elif action in ['nods', 'nod']:
-            return await self._action_nod()
-        elif action in ['shake_head', 'shakes_head']:
-            return await self._action_shake_head()
+        add(['nods', 'nod'], lambda p: self._action_nod())
+        add(['shake_head', 'shakes_head'], lambda p: self._action_shake_head())
 
-        else:
-            logger.warning(f"Unknown action: {action}")
-            return False
+        return table
 
     # ========== ACTION IMPLEMENTATIONS ==========
 
@@ -213,7 +303,8 @@ class StageActionHandler:
 
             expression = expression_map.get(pattern_name, 'happy')
             logger.info(f"💡 Setting LED pattern for '{pattern_name}' → expression '{expression}'")
-            self.expression_engine.set_expression(expression)
+            # set_expression blocks while the servos move - keep it off the event loop
+            await asyncio.to_thread(self.expression_engine.set_expression, expression)
             return True
         except Exception as e:
             logger.error(f"LED pattern failed: {e}")
@@ -229,10 +320,12 @@ class StageActionHandler:
         await asyncio.sleep(duration_sec)
         return True
 
-    def _action_sound_effect(self, sound_name: str) -> bool:
+    async def _action_sound_effect(self, sound_name: str) -> bool:
         """
         QUICK WIN #4: Sound effects (30 minutes)
         Play sound file for sighs, gasps, laughs, etc.
+
+        Waits for playback with asyncio.sleep, so the event loop keeps running.
         """
         # Normalize sound name (sighs → sigh)
         sound_map = {
@@ -246,7 +339,7 @@ class StageActionHandler:
         }
         canonical_name = sound_map.get(sound_name, sound_name)
 
-        return self.play_sound_effect(canonical_name)
+        return await self.play_sound_effect(canonical_name)
 
     async def _action_nod(self) -> bool:
         """Nod head up/down (future: need head tilt servo)"""
@@ -258,35 +351,136 @@ class StageActionHandler:
         logger.warning("Shake head action not implemented - requires head pan servo")
         return False
 
-    def play_sound_effect(self, sound_name: str, volume: float = 0.7) -> bool:
+    def _scaled_audio(self, sound_name: str, volume: float) -> np.ndarray:
         """
-        Play a sound effect
+        Get a cached sound effect scaled to a playback volume
 
         Args:
-            sound_name: Name of sound effect (e.g., 'sigh', 'gasp')
+            sound_name: Name of a cached sound effect
             volume: Playback volume 0.0-1.0
 
         Returns:
-            True if played successfully
+            int16 audio buffer at that volume (shared - do not modify)
         """
-        if sound_name not in self.sound_cache:
-            logger.warning(f"Sound effect '{sound_name}' not found in cache")
-            return False
+        audio_data, scaled, _ = self.sound_cache[sound_name]
+        if volume == DEFAULT_VOLUME:
+            return scaled
+
+        key = (sound_name, round(volume, 2))
+        scaled = self._scaled_cache.get(key)
+        if scaled is None:
+            if len(self._scaled_cache) >= _SCALED_CACHE_SIZE:
+                self._scaled_cache.pop(next(iter(self._scaled_cache)))  # Oldest
+            scaled = _scale_pcm(audio_data, key[1])
+            self._scaled_cache[key] = scaled
+        return scaled
+
+    def _audio_callback(self, outdata, frames, time_info, status):
+        """Output stream callback - copy queued effect audio, zero-pad on underrun"""
+        out = outdata[:, 0]
+        filled = 0
+        with self._queue_lock:
+            while filled < frames and self._queue:
+                buf = self._queue[0]
+                n = min(frames - filled, len(buf) - self._queue_pos)
+                out[filled:filled + n] = buf[self._queue_pos:self._queue_pos + n]
+                filled += n
+                self._queue_pos += n
+                if self._queue_pos >= len(buf):
+                    self._queue.popleft()
+                    self._queue_pos = 0
+        if filled < frames:
+            out[filled:] = 0
+
+    def _ensure_stream(self) -> bool:
+        """Open the persistent effect output stream on first use"""
+        if self._stream is None:
+            try:
+                self._stream = sd.OutputStream(samplerate=self.stream_rate, channels=1,
+                                               dtype='int16', blocksize=_STREAM_BLOCKSIZE,
+                                               callback=self._audio_callback)
+                self._stream.start()
+                self._exclusive_device = self._is_exclusive_device(self._stream.device)
+                logger.debug(f"Sound effect stream opened ({self.stream_rate}Hz, "
+                             f"{'exclusive' if self._exclusive_device else 'shared'} device)")
+            except Exception as e:
+                logger.error(f"Failed to open sound effect stream: {e}")
+                self._stream = None
+                return False
+        return True
+
+    @staticmethod
+    def _is_exclusive_device(device) -> bool:
+        """
+        Check whether an output device can only be opened by one stream
 
+        Args:
+            device: PortAudio device index
+
+        Returns:
+            True for a raw ALSA hw:/plughw: device (or if it can't be queried)
+        """
         try:
-            audio_data, sample_rate = self.sound_cache[sound_name]
+            return 'hw:' in sd.query_devices(device, 'output')['name']
+        except Exception as e:
+            logger.debug(f"Output device query failed: {e}")
+            return True
 
-            # Apply volume
-            audio_with_volume = audio_data * volume
+    def _queue_sound(self, sound_name: str, volume: float) -> Optional[float]:
+        """
+        Queue a sound effect on the persistent output stream
 
-            logger.info(f"🔊 Playing sound effect: {sound_name}")
-            sd.play(audio_with_volume, samplerate=sample_rate)
-            sd.wait()  # Wait for playback to finish
+        Args:
+            sound_name: Name of sound effect (e.g., 'sigh', 'gasp')
+            volume: Playback volume 0.0-1.0
 
-            return True
-        except Exception as e:
-            logger.error(f"Failed to play sound effect '{sound_name}': {e}")
+        Returns:
+            time.monotonic() at which it finishes playing, None if not played
+        """
+        if sound_name not in self.sound_cache:
+            logger.warning(f"Sound effect '{sound_name}' not found in cache")
+            return None
+        if not self._ensure_stream():
+            return None
+
+        audio = self._scaled_audio(sound_name, volume)
+        logger.info(f"🔊 Playing sound effect: {sound_name}")
+        with self._queue_lock:
+            # Plays after whatever is still queued
+            start = max(time.monotonic(), self._queued_until)
+            self._queued_until = start + len(audio) / self.stream_rate
+            self._queue.append(audio)
+            return self._queued_until
+
+    async def play_sound_effect(self, sound_name: str, volume: float = DEFAULT_VOLUME) -> bool:
+        """
+        Play a sound effect and wait for it to finish (event loop keeps running)
+
+        Args:
+            sound_name: Name of sound effect (e.g., 'sigh', 'gasp')
+            volume: Playback volume 0.0-1.0
+
+        Returns:
+            True if played successfully
+        """
+        end = self._queue_sound(sound_name, volume)
+        if end is None:
             return False
+        await asyncio.sleep(max(0.0, end - time.monotonic()))
+        return True
+
+    def close(self):
+        """Close the sound effect output stream (releases the audio device)"""
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception as e:
+                logger.debug(f"Sound effect stream close failed: {e}")
+            self._stream = None
+        with self._queue_lock:
+            self._queue.clear()
+            self._queue_pos = 0
+            self._queued_until = 0.0  # Nothing left to wait out after a reopen
 
     def insert_pause_in_audio(self, audio: np.ndarray, sample_rate: int,
                               pause_duration: float) -> np.ndarray:
@@ -302,11 +496,15 @@ class StageActionHandler:
             Audio with pause inserted
         """
         pause_samples = int(sample_rate * pause_duration)
-        silence = np.zeros(pause_samples, dtype=audio.dtype)
 
         # Insert pause at end (for simplicity)
         # TODO: Could parse action timing and insert mid-audio
-        return np.concatenate([audio, silence])
+        # One allocation: copy the audio in, zero only the tail
+        n = len(audio)
+        out = np.empty((n + pause_samples,) + audio.shape[1:], dtype=audio.dtype)
+        out[:n] = audio
+        out[n:] = 0
+        return out
 
 
 # Standalone test function
@@ -12,11 +12,97 @@ Handles:
 
 import cv2
 import numpy as np
+import os
 import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import threading
+import multiprocessing
+from multiprocessing import shared_memory
 from pathlib import Path
 from loguru import logger
 
+# Numba is optional - JIT-compiles the per-frame tracking math when installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (plain Python fallback)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def _track_target(x, y, w, h, frame_w, frame_h, cur_x, cur_y, alpha):
+    """
+    Face rectangle → smoothed look target
+
+    Args:
+        x, y, w, h: Face rectangle (pixels)
+        frame_w, frame_h: Frame size (pixels)
+        cur_x, cur_y: Current target (-1.0 to 1.0)
+        alpha: Smoothing factor (1.0 = jump straight to the face)
+
+    Returns:
+        (x, y): New target, -1.0 to 1.0 with 0 at frame center
+    """
+    new_x = ((x + w * 0.5) / frame_w - 0.5) * 2.0
+    new_y = ((y + h * 0.5) / frame_h - 0.5) * 2.0
+    return cur_x + (new_x - cur_x) * alpha, cur_y + (new_y - cur_y) * alpha
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT so the first tracked face isn't delayed by compilation
+    _track_target(0.0, 0.0, 1.0, 1.0, 2.0, 2.0, 0.0, 0.0, 0.5)
+
+
+def _detect_worker(shm_name, shape, frame_lock, frame_ready, results, stop, params):
+    """
+    Face detection process body - Haar cascade on frames from shared memory
+
+    Runs outside the main process's GIL. The capture thread copies each frame
+    to be checked into the shared buffer and sets frame_ready; face rectangles
+    (full-frame coordinates) come back on the results queue.
+
+    Args:
+        shm_name: SharedMemory block holding one BGR frame
+        shape: Frame shape (height, width, 3)
+        frame_lock: Held while the frame buffer is written/read
+        frame_ready: Set when a new frame is waiting
+        results: Queue of face lists [(x, y, w, h), ...]
+        stop: Set to exit
+        params: Dict with cascade, detect_scale, scale_factor, min_neighbors, min_size
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        cascade = cv2.CascadeClassifier(params['cascade'])
+        if cascade.empty():
+            # Exit - the capture thread sees the dead worker and detects in-thread
+            logger.error(f"Face detection worker: failed to load cascade {params['cascade']}")
+            return
+        scale = params['detect_scale']
+        small_size = (max(1, int(shape[1] * scale)), max(1, int(shape[0] * scale)))
+
+        while not stop.is_set():
+            if not frame_ready.wait(0.5):
+                continue
+            with frame_lock:
+                frame_ready.clear()
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            small = cv2.resize(gray, small_size, interpolation=cv2.INTER_AREA)
+            faces = cascade.detectMultiScale(small, scaleFactor=params['scale_factor'],
+                                             minNeighbors=params['min_neighbors'],
+                                             minSize=params['min_size'])
+            results.put(np.rint(faces / scale).astype(int).tolist() if len(faces) > 0 else [])
+    finally:
+        shm.close()
+
+
 class VisionHandler:
     """Manages camera and computer vision features"""
 
@@ -36,6 +122,13 @@ class VisionHandler:
         self.camera_device = self.hardware_config.get('camera_device', 0)
         self.camera_resolution = tuple(self.hardware_config.get('camera_resolution', [640, 480]))
         self.camera_fps = self.hardware_config.get('camera_fps', 5)
+        self.capture_cpu = self.hardware_config.get('camera_cpu', 3)  # None = no pinning
+        # Empty scene: after camera_idle_after seconds with no face or motion the
+        # capture loop drops to camera_fps_idle and only checks for motion
+        perf_config = config.get('performance', {})
+        self.camera_fps_idle = perf_config.get('camera_fps_idle', 1)
+        self.camera_idle_after = perf_config.get('camera_idle_after', 10.0)
+        self._last_activity = time.monotonic()
 
         self.camera = None
         self.frame = None
@@ -46,12 +139,53 @@ class VisionHandler:
         self.cascade_path = self.config.get('face_detection', {}).get('cascade',
                                            'haarcascade_frontalface_default.xml')
         self.face_cascade = None
+        # Cascade runs on a downscaled frame (4x fewer pixels at 0.5) - min_size
+        # stays in full-frame pixels and is scaled to match
+        face_cfg = self.config.get('face_detection', {})
+        self.detect_scale = face_cfg.get('detect_scale', 0.5)
+        self.scale_factor = face_cfg.get('scale_factor', 1.1)
+        self.min_neighbors = face_cfg.get('min_neighbors', 5)
+        self.min_size = tuple(max(1, int(v * self.detect_scale))
+                              for v in face_cfg.get('min_size', [30, 30]))
+        # OpenCL (Transparent API / UMat) for the in-thread detection and motion
+        # pipeline - opt-in, only used when OpenCV finds an OpenCL device
+        self.use_opencl = False
+        if face_cfg.get('opencl', False):
+            if cv2.ocl.haveOpenCL():
+                cv2.ocl.setUseOpenCL(True)
+                self.use_opencl = cv2.ocl.useOpenCL()
+            if self.use_opencl:
+                logger.info(f"OpenCL enabled ({cv2.ocl.Device.getDefault().name()})")
+            else:
+                logger.warning("OpenCL requested but unavailable - using CPU path")
+        self._gray = None  # Reused grayscale / downscaled buffers
+        self._gray_small = None
+        self._bgr_small = None
+        # Detector: 'haar' (cascade, default) or 'yunet' (OpenCV DNN CNN, needs
+        # the ONNX model - falls back to haar when unavailable)
+        self.detector_type = face_cfg.get('detector', 'haar')
+        self.yunet_model = face_cfg.get('yunet_model', 'data/models/face_detection_yunet_2023mar.onnx')
+        self.yunet_score_threshold = face_cfg.get('score_threshold', 0.7)
+        self.face_detector = None
+        # Capture-loop detection in a separate process (Haar only) - frames go
+        # through shared memory, so the cascade runs outside this GIL
+        self.detect_in_process = face_cfg.get('worker_process', True)
+        self._detect_proc = None
+        self._shm = None
+        self._shm_frame = None
+        self._shm_lock = None
+        self._frame_ready = None
+        self._detect_results = None
+        self._detect_stop = None
 
         # Face recognition
         self.face_recognition_enabled = self.config.get('face_recognition', {}).get('enabled', True)
         self.known_faces_dir = Path(self.config.get('face_recognition', {}).get('known_faces_dir',
                                                                                   '/Gary/GairiHead/data/faces'))
         self.known_faces = {}  # {name: encoding}
+        # known_faces stacked for one vectorized distance pass (see load_known_faces)
+        self._known_names = []
+        self._known_matrix = None  # (N, 128) ndarray
         self.tolerance = self.config.get('face_recognition', {}).get('tolerance', 0.6)
 
         # Tracking
@@ -63,14 +197,59 @@ class VisionHandler:
         # Motion detection
         self.motion_detection_enabled = self.config.get('face_detection', {}).get('enabled', True)
         self.previous_frame = None
-        self.motion_threshold = 5000  # Pixel change threshold
+        self.motion_threshold = 5000  # Pixel change threshold (full-frame pixels)
+        self.motion_size = (160, 120)  # Motion is measured on a downscaled frame
+        # Reused motion buffers - previous_frame and _motion_blur swap each frame
+        motion_shape = self.motion_size[::-1]
+        self._motion_gray = None  # Full-resolution grayscale, sized on first frame
+        self._motion_small = np.empty(motion_shape, dtype=np.uint8)
+        self._motion_blur = np.empty(motion_shape, dtype=np.uint8)
+        self._motion_delta = np.empty(motion_shape, dtype=np.uint8)
+        self._motion_thresh = np.empty(motion_shape, dtype=np.uint8)
+
+        # Gated face detection: static scenes reuse the last result and only
+        # re-run the cascade every face_redetect_interval seconds
+        self.face_redetect_interval = 2.0
+        self._last_faces = []
+        self._last_face_detect_time = 0.0
 
         # Threading
         self.capture_thread = None
         self.frame_lock = threading.Lock()
 
+        # Load models now so the first detected face doesn't pay for it
+        self.warm_up()
+
         logger.info("VisionHandler initialized")
 
+    def warm_up(self):
+        """
+        Load and exercise the vision models ahead of the first real frame
+
+        Loads the face cascade, imports face_recognition (loads dlib's models)
+        and known faces, and runs each detector once on a blank frame.
+        Failures are logged and leave the lazy paths to retry/disable.
+        """
+        start = time.time()
+        cv2.setNumThreads(4)  # Pi 5: four A76 cores
+
+        blank = np.zeros((self.camera_resolution[1], self.camera_resolution[0], 3), dtype=np.uint8)
+        if self.face_detection_enabled:
+            self.detect_faces(blank)  # Lazy-loads + exercises the detector
+
+        if self.face_recognition_enabled:
+            try:
+                import face_recognition
+                face_recognition.face_encodings(np.zeros((64, 64, 3), dtype=np.uint8))
+            except ImportError:
+                pass  # load_known_faces() reports and disables recognition
+            except Exception as e:
+                logger.debug(f"face_recognition warm-up failed: {e}")
+            if len(self.known_faces) == 0:
+                self.load_known_faces()
+
+        logger.debug(f"Vision warm-up done ({(time.time() - start) * 1000:.0f}ms)")
+
     def start(self):
         """Start camera and vision processing"""
         logger.info("Starting vision handler...")
@@ -81,6 +260,8 @@ class VisionHandler:
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.camera_resolution[0])
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.camera_resolution[1])
             self.camera.set(cv2.CAP_PROP_FPS, self.camera_fps)
+            # read() then returns the newest frame, not a stale buffered one
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
             if not self.camera.isOpened():
                 raise Exception(f"Failed to open camera {self.camera_device}")
@@ -90,8 +271,8 @@ class VisionHandler:
             logger.error(f"Camera initialization failed: {e}")
             return False
 
-        # Load face detection cascade
-        if self.face_detection_enabled:
+        # Load face detection cascade (normally already loaded by warm_up)
+        if self.face_detection_enabled and self.face_cascade is None:
             try:
                 # Try OpenCV data directory
                 cascade_full_path = cv2.data.haarcascades + self.cascade_path
@@ -105,8 +286,8 @@ class VisionHandler:
                 logger.warning(f"Face detection disabled: {e}")
                 self.face_detection_enabled = False
 
-        # Load known faces
-        if self.face_recognition_enabled:
+        # Load known faces (normally already loaded by warm_up)
+        if self.face_recognition_enabled and len(self.known_faces) == 0:
             self.load_known_faces()
 
         # Start capture thread
@@ -125,15 +306,111 @@ class VisionHandler:
         if self.capture_thread:
             self.capture_thread.join(timeout=2.0)
 
+        self._stop_detect_worker()
+
         if self.camera:
             self.camera.release()
 
         logger.info("Vision handler stopped")
 
+    def _start_detect_worker(self, shape):
+        """
+        Start the face detection process for frames of this shape
+
+        Args:
+            shape: Frame shape (height, width, 3)
+
+        Returns:
+            bool: True if the worker is running
+        """
+        try:
+            self._shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+            self._shm_frame = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+            # spawn, not fork - forking a threaded OpenCV process is unsafe
+            ctx = multiprocessing.get_context('spawn')
+            self._shm_lock = ctx.Lock()
+            self._frame_ready = ctx.Event()
+            self._detect_results = ctx.Queue()
+            self._detect_stop = ctx.Event()
+            params = {
+                'cascade': cv2.data.haarcascades + self.cascade_path,
+                'detect_scale': self.detect_scale,
+                'scale_factor': self.scale_factor,
+                'min_neighbors': self.min_neighbors,
+                'min_size': self.min_size,
+            }
+            self._detect_proc = ctx.Process(
+                target=_detect_worker, name='face-detect',
+                args=(self._shm.name, shape, self._shm_lock, self._frame_ready,
+                      self._detect_results, self._detect_stop, params),
+                daemon=True)
+            self._detect_proc.start()
+            logger.info("Face detection worker process started")
+            return True
+        except Exception as e:
+            logger.warning(f"Face detection worker unavailable, detecting in-thread: {e}")
+            self._stop_detect_worker()
+            self.detect_in_process = False
+            return False
+
+    def _stop_detect_worker(self):
+        """Stop the face detection process and free the shared frame buffer"""
+        if self._detect_proc is not None:
+            self._detect_stop.set()
+            self._detect_proc.join(timeout=2.0)
+            if self._detect_proc.is_alive():
+                self._detect_proc.terminate()
+            self._detect_proc = None
+        if self._shm is not None:
+            self._shm_frame = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _pin_capture_thread(self):
+        """
+        Pin the calling (capture) thread to capture_cpu and raise its priority
+
+        Keeps the capture/detection work on one core (warm caches, no
+        migration) and ahead of background work. Best effort - raising
+        priority needs CAP_SYS_NICE.
+        """
+        if self.capture_cpu is None:
+            return
+        tid = threading.get_native_id()
+        try:
+            os.sched_setaffinity(tid, {self.capture_cpu})
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Capture thread affinity not set: {e}")
+        try:
+            # Linux niceness is per thread - only this one is raised
+            os.setpriority(os.PRIO_PROCESS, tid, -5)
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Capture thread priority not raised: {e}")
+
     def _capture_loop(self):
         """Background thread for continuous frame capture"""
+        self._pin_capture_thread()
+        frame_period = 1.0 / self.camera_fps
+        idle_period = 1.0 / self.camera_fps_idle
+        idle = False
+        next_idle_frame = 0.0
         while self.running:
             try:
+                # Idle needs motion detection to wake back up
+                now = time.monotonic()
+                was_idle = idle
+                idle = (self.motion_detection_enabled
+                        and now - self._last_activity > self.camera_idle_after)
+                if idle != was_idle:
+                    logger.debug(f"Vision {'idle' if idle else 'active'} "
+                                 f"({self.camera_fps_idle if idle else self.camera_fps}fps)")
+                if idle:
+                    time.sleep(max(0.0, next_idle_frame - now))
+                    next_idle_frame = max(next_idle_frame, now) + idle_period
+
+                # read() blocks until the camera delivers the next frame at
+                # its configured FPS - that paces the loop, no extra sleep
                 ret, frame = self.camera.read()
 
                 if not ret:
@@ -144,11 +421,19 @@ class VisionHandler:
                 with self.frame_lock:
                     self.frame = frame
 
+                if idle:
+                    # Motion check only - full processing resumes once it fires
+                    if self.detect_motion(frame) > self.motion_threshold:
+                        self._last_activity = time.monotonic()
+                    continue
+
                 # Process frame
+                t0 = time.monotonic()
                 self._process_frame(frame)
-
-                # Limit frame rate
-                time.sleep(1.0 / self.camera_fps)
+                elapsed = time.monotonic() - t0
+                if elapsed > frame_period:
+                    logger.debug(f"Frame processing overran ({elapsed * 1000:.0f}ms > "
+                                 f"{frame_period * 1000:.0f}ms frame period)")
 
             except Exception as e:
                 logger.error(f"Capture loop error: {e}")
@@ -156,12 +441,55 @@ class VisionHandler:
 
     def _process_frame(self, frame):
         """Process a single frame"""
-        # Face detection
+        # Motion detection first - much cheaper than the cascade, and gates it
+        motion_level = None
+        if self.motion_detection_enabled:
+            motion_level = self.detect_motion(frame)
+
+            if motion_level > self.motion_threshold:
+                logger.debug(f"Motion detected: {motion_level}")
+                self._last_activity = time.monotonic()
+
+        # Face detection (static scene: reuse the last faces until re-check is due)
         if self.face_detection_enabled:
-            faces = self.detect_faces(frame)
+            now = time.time()
+            due = (motion_level is None or motion_level > self.motion_threshold // 4
+                   or now - self._last_face_detect_time > self.face_redetect_interval)
+
+            if self._detect_proc is not None and not self._detect_proc.is_alive():
+                # Worker died (bad cascade, OpenCV crash) - no results would ever come
+                logger.warning(f"Face detection worker exited (code {self._detect_proc.exitcode}), "
+                               f"detecting in-thread")
+                self._stop_detect_worker()
+                self.detect_in_process = False
+
+            if (self._detect_proc is None and self.detect_in_process
+                    and self.detector_type == 'haar'):
+                self._start_detect_worker(frame.shape)
+
+            if self._detect_proc is not None and frame.shape == self._shm_frame.shape:
+                # Hand the frame to the worker, pick up whatever it has finished
+                if due:
+                    with self._shm_lock:
+                        np.copyto(self._shm_frame, frame)
+                        self._frame_ready.set()
+                    self._last_face_detect_time = now
+                try:
+                    while True:
+                        self._last_faces = self._detect_results.get_nowait()
+                except queue.Empty:
+                    pass
+                faces = self._last_faces
+            elif due:
+                faces = self.detect_faces(frame)
+                self._last_faces = faces
+                self._last_face_detect_time = now
+            else:
+                faces = self._last_faces
 
             if faces:
                 self.last_face_time = time.time()
+                self._last_activity = time.monotonic()
 
                 # Track largest face
                 largest_face = max(faces, key=lambda f: f[2] * f[3])
@@ -173,13 +501,6 @@ class VisionHandler:
                     if len(faces) > 0:
                         self.expression_engine.set_expression('alert')
 
-        # Motion detection
-        if self.motion_detection_enabled:
-            motion_level = self.detect_motion(frame)
-
-            if motion_level > self.motion_threshold:
-                logger.debug(f"Motion detected: {motion_level}")
-
     def detect_faces(self, frame):
         """
         Detect faces in frame
@@ -193,6 +514,11 @@ class VisionHandler:
         if not self.face_detection_enabled:
             return []
 
+        if self.detector_type == 'yunet':
+            faces = self._detect_faces_yunet(frame)
+            if faces is not None:
+                return faces
+
         # Lazy-load face cascade if not already loaded
         if self.face_cascade is None:
             try:
@@ -208,18 +534,75 @@ class VisionHandler:
                 logger.error(f"Failed to load cascade: {e}")
                 return []
 
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        h, w = frame.shape[:2]
+        small_size = (max(1, int(w * self.detect_scale)), max(1, int(h * self.detect_scale)))
+        if self.use_opencl:
+            # UMats stay on the GPU until detectMultiScale hands back the rectangles
+            gray = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2GRAY)
+            small = cv2.resize(gray, small_size, interpolation=cv2.INTER_AREA)
+        else:
+            # Convert to grayscale, then downscale (both into buffers reused across frames)
+            if self._gray is None or self._gray.shape != (h, w):
+                self._gray = np.empty((h, w), dtype=np.uint8)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+            if self._gray_small is None or self._gray_small.shape != small_size[::-1]:
+                self._gray_small = np.empty(small_size[::-1], dtype=np.uint8)
+            small = cv2.resize(gray, small_size, dst=self._gray_small, interpolation=cv2.INTER_AREA)
 
         # Detect faces
         faces = self.face_cascade.detectMultiScale(
-            gray,
-            scaleFactor=self.config.get('face_detection', {}).get('scale_factor', 1.1),
-            minNeighbors=self.config.get('face_detection', {}).get('min_neighbors', 5),
-            minSize=tuple(self.config.get('face_detection', {}).get('min_size', [30, 30]))
+            small,
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=self.min_size
         )
 
-        return faces.tolist() if len(faces) > 0 else []
+        if len(faces) == 0:
+            return []
+        # Back to full-frame coordinates
+        return np.rint(np.asarray(faces) / self.detect_scale).astype(int).tolist()
+
+    def _detect_faces_yunet(self, frame):
+        """
+        Detect faces with OpenCV's YuNet CNN (cv2.FaceDetectorYN)
+
+        Args:
+            frame: OpenCV frame (BGR - no grayscale conversion needed)
+
+        Returns:
+            list: Face rectangles [(x, y, w, h), ...], or None if YuNet is
+            unavailable (detector_type is then switched to 'haar')
+        """
+        # Lazy-load detector if not already loaded
+        if self.face_detector is None:
+            model = Path(self.yunet_model)
+            if not model.is_absolute():
+                model = Path(__file__).parent.parent / model
+            try:
+                if not model.exists():
+                    raise FileNotFoundError(model)
+                self.face_detector = cv2.FaceDetectorYN.create(
+                    str(model), '', (320, 240), score_threshold=self.yunet_score_threshold)
+                logger.debug("YuNet face detector lazy-loaded")
+            except (AttributeError, FileNotFoundError, cv2.error) as e:
+                logger.warning(f"YuNet face detector unavailable, using Haar cascade: {e}")
+                self.detector_type = 'haar'
+                return None
+
+        # Same downscale as the cascade path, into a reused buffer
+        h, w = frame.shape[:2]
+        small_size = (max(1, int(w * self.detect_scale)), max(1, int(h * self.detect_scale)))
+        if self._bgr_small is None or self._bgr_small.shape[:2] != small_size[::-1]:
+            self._bgr_small = np.empty((small_size[1], small_size[0], 3), dtype=np.uint8)
+        small = cv2.resize(frame, small_size, dst=self._bgr_small, interpolation=cv2.INTER_AREA)
+
+        self.face_detector.setInputSize(small_size)
+        _, faces = self.face_detector.detect(small)
+        if faces is None or len(faces) == 0:
+            return []
+        # Rows are (x, y, w, h, 5 landmarks, score) - keep the box, full-frame coordinates
+        return np.rint(faces[:, :4] / self.detect_scale).astype(int).tolist()
 
     def _track_face(self, face_rect, frame_shape):
         """
@@ -235,21 +618,17 @@ class VisionHandler:
         x, y, w, h = face_rect
         frame_h, frame_w = frame_shape[:2]
 
-        # Calculate face center
-        face_center_x = (x + w/2) / frame_w  # 0.0 to 1.0
-        face_center_y = (y + h/2) / frame_h  # 0.0 to 1.0
-
-        # Normalize to -1.0 to 1.0 (center is 0)
-        normalized_x = (face_center_x - 0.5) * 2.0
-        normalized_y = (face_center_y - 0.5) * 2.0
-
-        # Smooth tracking
+        # Face center normalized to -1.0 to 1.0 (center is 0), then smoothed -
+        # the first sighting jumps straight there
         if self.current_target:
-            smoothed_x = self.current_target[0] + (normalized_x - self.current_target[0]) * self.smooth_factor
-            smoothed_y = self.current_target[1] + (normalized_y - self.current_target[1]) * self.smooth_factor
-            self.current_target = (smoothed_x, smoothed_y)
+            cur_x, cur_y = self.current_target
+            alpha = self.smooth_factor
         else:
-            self.current_target = (normalized_x, normalized_y)
+            cur_x = cur_y = 0.0
+            alpha = 1.0
+        self.current_target = _track_target(float(x), float(y), float(w), float(h),
+                                            float(frame_w), float(frame_h),
+                                            cur_x, cur_y, float(alpha))
 
         # Update expression engine
         if self.expression_engine:
@@ -263,70 +642,117 @@ class VisionHandler:
             frame: Current frame
 
         Returns:
-            int: Motion level (pixel difference count)
+            int: Motion level (changed pixel count, in full-frame pixels)
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        gray = cv2.GaussianBlur(gray, (21, 21), 0)
+        # Motion doesn't need full resolution - downscale before the blur
+        # (21x21 kernel at 640 wide ≈ 5x5 at 160)
+        h, w = frame.shape[:2]
+        if self.use_opencl:
+            changed = self._detect_motion_opencl(frame)
+            return changed * (w * h) // (self.motion_size[0] * self.motion_size[1])
+
+        if self._motion_gray is None or self._motion_gray.shape != (h, w):
+            self._motion_gray = np.empty((h, w), dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._motion_gray)
+        cv2.resize(self._motion_gray, self.motion_size, dst=self._motion_small,
+                   interpolation=cv2.INTER_AREA)
+        blurred = cv2.GaussianBlur(self._motion_small, (5, 5), 0, dst=self._motion_blur)
 
         if self.previous_frame is None:
-            self.previous_frame = gray
+            # Keep this buffer as the reference, blur into a fresh one next time
+            self.previous_frame = blurred
+            self._motion_blur = np.empty_like(blurred)
             return 0
 
         # Calculate difference
-        frame_delta = cv2.absdiff(self.previous_frame, gray)
-        thresh = cv2.threshold(frame_delta, 25, 255, cv2.THRESH_BINARY)[1]
+        cv2.absdiff(self.previous_frame, blurred, dst=self._motion_delta)
+        cv2.threshold(self._motion_delta, 25, 255, cv2.THRESH_BINARY, dst=self._motion_thresh)
 
-        # Count changed pixels
-        motion_level = np.sum(thresh) / 255
+        # Count changed pixels, scaled back up so motion_threshold keeps its meaning
+        motion_level = (cv2.countNonZero(self._motion_thresh) * (w * h)
+                        // (self.motion_size[0] * self.motion_size[1]))
 
-        self.previous_frame = gray
+        # Swap buffers - this frame becomes the reference, the old one is reused
+        self.previous_frame, self._motion_blur = blurred, self.previous_frame
 
         return motion_level
 
+    def _detect_motion_opencl(self, frame):
+        """
+        detect_motion pipeline on UMats (OpenCL)
+
+        Args:
+            frame: Current frame
+
+        Returns:
+            int: Changed pixel count at motion_size
+        """
+        gray = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(gray, self.motion_size, interpolation=cv2.INTER_AREA)
+        blurred = cv2.GaussianBlur(small, (5, 5), 0)
+
+        previous = self.previous_frame
+        self.previous_frame = blurred
+        if not isinstance(previous, cv2.UMat):
+            return 0
+
+        frame_delta = cv2.absdiff(previous, blurred)
+        thresh = cv2.threshold(frame_delta, 25, 255, cv2.THRESH_BINARY)[1]
+        return cv2.countNonZero(thresh)
+
     def load_known_faces(self):
         """Load known face encodings from disk"""
         logger.info(f"Loading known faces from {self.known_faces_dir}")
 
-        if not self.known_faces_dir.exists():
-            self.known_faces_dir.mkdir(parents=True, exist_ok=True)
-            logger.info("Created known faces directory")
-            return
-
         try:
+            # Inside the try: a read-only data dir must not fail warm_up()/VisionHandler()
+            if not self.known_faces_dir.exists():
+                self.known_faces_dir.mkdir(parents=True, exist_ok=True)
+                logger.info("Created known faces directory")
+                return
+
             import face_recognition
-            import os
 
             # Load all images from subdirectories (e.g., known_faces/tim/*.jpg)
+            jobs = []  # (person_name, image_file)
             for person_dir in self.known_faces_dir.iterdir():
                 if not person_dir.is_dir():
                     continue
-
                 person_name = person_dir.name.title()
-                logger.debug(f"Loading faces for: {person_name}")
-
-                # Collect all encodings for this person
-                encodings = []
-
-                for image_file in person_dir.glob('*.jpg'):
-                    try:
-                        # Load image and extract face encoding
-                        image = face_recognition.load_image_file(str(image_file))
-                        file_encodings = face_recognition.face_encodings(image)
-
-                        if len(file_encodings) > 0:
-                            encodings.append(file_encodings[0])
-                            logger.debug(f"  Loaded: {image_file.name}")
-                        else:
-                            logger.warning(f"  No face in: {image_file.name}")
-                    except Exception as e:
-                        logger.warning(f"  Failed to load {image_file.name}: {e}")
-
-                # Average all encodings for this person (more robust recognition)
-                if len(encodings) > 0:
-                    import numpy as np
-                    avg_encoding = np.mean(encodings, axis=0)
-                    self.known_faces[person_name] = avg_encoding
-                    logger.info(f"Loaded {len(encodings)} face encodings for: {person_name}")
+                jobs.extend((person_name, image_file) for image_file in person_dir.glob('*.jpg'))
+
+            def encode_one(image_file):
+                """First face encoding in one image (None if no face / unreadable)"""
+                try:
+                    image = face_recognition.load_image_file(str(image_file))
+                    file_encodings = face_recognition.face_encodings(image)
+                except Exception as e:
+                    logger.warning(f"  Failed to load {image_file.name}: {e}")
+                    return None
+                if len(file_encodings) == 0:
+                    logger.warning(f"  No face in: {image_file.name}")
+                    return None
+                logger.debug(f"  Loaded: {image_file.name}")
+                return file_encodings[0]
+
+            # dlib releases the GIL while encoding, so threads run on all cores
+            with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as pool:
+                results = list(pool.map(encode_one, [image_file for _, image_file in jobs]))
+
+            # Collect all encodings per person
+            by_person = {}
+            for (person_name, _), encoding in zip(jobs, results):
+                if encoding is not None:
+                    by_person.setdefault(person_name, []).append(encoding)
+
+            # Average all encodings for this person (more robust recognition)
+            for person_name, encodings in by_person.items():
+                self.known_faces[person_name] = np.mean(encodings, axis=0)
+                logger.info(f"Loaded {len(encodings)} face encodings for: {person_name}")
+
+            if self.known_faces:
+                self._known_names = list(self.known_faces.keys())
+                self._known_matrix = np.stack(list(self.known_faces.values()))
 
             logger.info(f"Loaded {len(self.known_faces)} known people")
 
@@ -365,6 +791,8 @@ class VisionHandler:
 
             # Extract face region (convert to RGB for face_recognition library)
             face_image = frame[y:y+h, x:x+w]
+            # No recognition cache: the name sets the authorization level, and a
+            # hash of the crop can't tell two people apart - always encode
             rgb_face = cv2.cvtColor(face_image, cv2.COLOR_BGR2RGB)
 
             # Get face encoding
@@ -375,14 +803,14 @@ class VisionHandler:
 
             face_encoding = encodings[0]
 
-            # Compare with known faces
-            for name, known_encoding in self.known_faces.items():
-                # Calculate distance (lower = more similar)
-                distance = face_recognition.face_distance([known_encoding], face_encoding)[0]
-
-                if distance < self.tolerance:
-                    logger.debug(f"Recognized {name} (distance: {distance:.2f})")
-                    return name
+            # Compare with all known faces at once (Euclidean distance, lower =
+            # more similar - same metric as face_recognition.face_distance)
+            distances = np.linalg.norm(self._known_matrix - face_encoding, axis=1)
+            idx = int(np.argmin(distances))
+            if distances[idx] < self.tolerance:
+                name = self._known_names[idx]
+                logger.debug(f"Recognized {name} (distance: {distances[idx]:.2f})")
+                return name
 
             return "Unknown"
 
@@ -28,28 +28,172 @@ Core Principles Applied:
 - #8: Do it well (proper error handling, logging, fallbacks)
 """
 
-import whisper
 import sounddevice as sd
 import numpy as np
 import wave
 import io
+import math
+import os
 import time
+import queue
+import threading
 import tempfile
 import random
+import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from loguru import logger
 from typing import Optional, Dict, Tuple
 import webrtcvad
 from scipy import signal  # For pitch shifting
 
+# libyaml C parser when PyYAML was built with it (pure-Python fallback)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Numba is optional - JIT-compiles the speech mouth-animation math when installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (plain Python fallback)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Local STT fallback: faster-whisper (CTranslate2, int8) when installed,
+# otherwise openai-whisper (PyTorch, fp32)
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+    import whisper
+
 # Try to import Piper, fall back to pyttsx3 if not available
 try:
     from piper import PiperVoice
     PIPER_AVAILABLE = True
 except ImportError:
     PIPER_AVAILABLE = False
+
+# pyttsx3 (espeak) - used when Piper is missing or fails to load
+try:
     import pyttsx3
+    PYTTSX3_AVAILABLE = True
+except ImportError:
+    PYTTSX3_AVAILABLE = False
+
+
+def _rms(audio: np.ndarray) -> float:
+    """
+    RMS level of an audio buffer
+
+    One BLAS dot product over a flat view - no squared temporary, which
+    matters in the real-time playback callback.
+
+    Args:
+        audio: float audio samples (any shape)
+
+    Returns:
+        RMS amplitude (0.0 for an empty buffer)
+    """
+    flat = audio.reshape(-1)
+    if flat.size == 0:
+        return 0.0
+    return math.sqrt(float(flat @ flat) / flat.size)
+
+
+@njit(cache=True, fastmath=True)
+def _update_mouth(level, sensitivity, mouth_range, neutral, max_angle):
+    """
+    Audio-reactive mouth position for one playback chunk
+
+    Runs in the PortAudio callback thread - compiled so the per-chunk math
+    doesn't pay interpreter overhead.
+
+    Args:
+        level: Smoothed RMS amplitude (envelope at the end of the chunk)
+        sensitivity: Mouth sensitivity (0-1)
+        mouth_range: Degrees from neutral at full amplitude
+        neutral: Neutral (closed) mouth angle
+        max_angle: Maximum mouth angle
+
+    Returns:
+        Mouth angle (int degrees, neutral..max_angle)
+    """
+    # Non-linear scaling for a more natural look (8.0x boost for more dramatic movement)
+    scaled_amplitude = math.sqrt(level) * sensitivity * 8.0
+
+    # Clamp to 0-1, then map (no minimum threshold for maximum responsiveness)
+    smoothed = min(1.0, max(0.0, scaled_amplitude))
+    mouth_pos = neutral + int(mouth_range * smoothed)
+    return max(neutral, min(max_angle, mouth_pos))
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT so the first utterance's callback isn't delayed by compilation
+    _update_mouth(0.0, 0.7, 28.0, 10, 50)
+
+
+# TTS text cleanup (see VoiceHandler._clean_text_for_tts)
+_TTS_URL_RE = re.compile(r'http[s]?://\S+')  # URLs sound terrible when read
+_TTS_TRANSLATE_TABLE = str.maketrans({
+    '\u2026': '. ',  # Unicode ellipsis
+    # Quotes (TTS doesn't need to say "quote")
+    '"': None, '\u201c': None, '\u201d': None,
+    "'": None, '\u2018': None, '\u2019': None,
+    # Parentheses (keep content, remove parens)
+    '(': None, ')': None, '[': None, ']': None,
+    '*': None,  # Markdown emphasis
+    '_': ' ',   # Markdown emphasis
+    ';': ',',   # Semicolon → comma (more natural pause)
+})
+_TTS_DASH_RE = re.compile(r' [-\u2014\u2013] ')
+_TTS_COLON_RE = re.compile(r':\s')
+_TTS_SPACE_RE = re.compile(r'\s+')
+_TTS_REPEAT_RE = re.compile(r'([.,])\1+')
+
+# Streamed replies are spoken a chunk at a time. A sentence ends at .?! (and any
+# closing quote/bracket) followed by whitespace - so "3.5" isn't split mid-number
+_SPEECH_BREAK_RE = re.compile(r'[.?!]+["\')\]]*\s+')
+_SPEECH_CLAUSE_RE = re.compile(r',\s+')
+_SPEECH_MAX_WORDS = 80  # Run-on text is cut at a word boundary past this
+_SPEECH_MARKER_RE = re.compile(r'\*[^*]*\*')  # *stage direction* markers
+
+
+def _next_speech_chunk(buffer: str, first: bool) -> Tuple[str, str]:
+    """
+    Split the next speakable chunk off streamed response text
+
+    Args:
+        buffer: Text received but not spoken yet
+        first: Nothing spoken yet - also break at a comma after 4+ words so the
+               first audio starts sooner (later chunks stay whole sentences)
+
+    Returns:
+        (chunk, rest) - chunk is '' until a boundary has arrived
+    """
+    match = _SPEECH_BREAK_RE.search(buffer)
+    if match:
+        return buffer[:match.end()].strip(), buffer[match.end():]
+
+    if first:
+        for match in _SPEECH_CLAUSE_RE.finditer(buffer):
+            if len(buffer[:match.start()].split()) >= 4:
+                return buffer[:match.end()].strip(), buffer[match.end():]
+
+    if len(buffer.split()) > _SPEECH_MAX_WORDS:
+        cut = buffer.rstrip().rfind(' ')
+        return buffer[:cut].strip(), buffer[cut:]
+
+    return '', buffer
 
 
 class VoiceHandler:
@@ -74,16 +218,26 @@ class VoiceHandler:
         self.sample_rate = self.config.get('microphone', {}).get('sample_rate', 16000)
         self.chunk_size = self.config.get('microphone', {}).get('chunk_size', 1024)
         self.device_index = self.config.get('microphone', {}).get('device_index', None)
+        # VAD input stream - opened on first recording. keep_open leaves it
+        # running between recordings (no device open per turn) but holds the mic,
+        # so other processes (gairi_head_server record_audio) can't use it
+        self.keep_input_open = self.config.get('microphone', {}).get('keep_open', False)
+        self._input_stream = None
 
         # VAD settings
         self.vad_enabled = self.config.get('vad', {}).get('enabled', True)
         self.vad_aggressiveness = self.config.get('vad', {}).get('aggressiveness', 3)  # 3 = most strict (filters noise better)
         self.vad_silence_duration = self.config.get('vad', {}).get('silence_duration', 1.5)
         self.vad_max_duration = self.config.get('vad', {}).get('max_duration', 30.0)
+        # VAD frame parameters (must be 10, 20, or 30ms) - fixed by sample_rate
+        self._vad_frame_ms = 30
+        self._vad_frame_size = int(self.sample_rate * self._vad_frame_ms / 1000)  # samples per frame
+        self._vad = webrtcvad.Vad(self.vad_aggressiveness)  # Reused; mode set per recording
 
         # Whisper STT
         self.whisper_model = None
         self.whisper_model_name = self.config.get('stt', {}).get('model', 'tiny')
+        self.whisper_language = self.config.get('stt', {}).get('language', 'en')  # Skips language detection
         self.use_remote_transcription = self.config.get('stt', {}).get('use_remote', True)
 
         # TTS settings
@@ -94,6 +248,11 @@ class VoiceHandler:
         self.tts_speed = self.config.get('tts', {}).get('speed', 1.0)
         self.tts_volume = self.config.get('tts', {}).get('volume', 0.8)
         self.tts_model_path = self.config.get('tts', {}).get('model_path', '/home/tim/GairiHead/data/piper_voices')
+        self.tts_quantize = self.config.get('tts', {}).get('quantize', False)  # int8 voice model
+        self.tts_ep = self.config.get('tts', {}).get('ep', 'cpu')  # 'openvino' or 'cpu'
+        # Optimized ONNX graphs / OpenVINO kernel blobs, reused across restarts
+        self.tts_cache_dir = Path(self.config.get('tts', {}).get(
+            'cache_dir', Path.home() / '.cache' / 'gairihead')).expanduser()
 
         # Load voice emotion mappings (v2.1 - emotion-based voice modulation)
         self.voice_emotions = self._load_voice_emotions()
@@ -128,7 +287,7 @@ class VoiceHandler:
                 return {}
 
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
 
             emotions = config.get('voice_emotions', {})
             logger.debug(f"Loaded {len(emotions)} voice emotion mappings")
@@ -143,9 +302,15 @@ class VoiceHandler:
         if self.whisper_model is None:
             logger.info(f"Loading Whisper model '{self.whisper_model_name}'...")
             start = time.time()
-            self.whisper_model = whisper.load_model(self.whisper_model_name)
+            if FASTER_WHISPER_AVAILABLE:
+                # int8 weights: ~4x smaller and 2-3x faster than fp32 on the Pi CPU
+                self.whisper_model = WhisperModel(self.whisper_model_name, device="cpu",
+                                                  compute_type="int8")
+            else:
+                self.whisper_model = whisper.load_model(self.whisper_model_name)
             load_time = int((time.time() - start) * 1000)
-            logger.success(f"✅ Whisper model loaded ({load_time}ms)")
+            backend = "faster-whisper int8" if FASTER_WHISPER_AVAILABLE else "openai-whisper"
+            logger.success(f"✅ Whisper model loaded ({backend}, {load_time}ms)")
         return self.whisper_model
 
     def _init_tts_engine(self):
@@ -158,7 +323,19 @@ class VoiceHandler:
             try:
                 # Load Piper voice model
                 model_file = f"{self.tts_model_path}/en_US-{self.tts_voice}-medium.onnx"
-                self.piper_voice = PiperVoice.load(model_file)
+                session_file = self._quantized_piper_model(model_file) if self.tts_quantize else model_file
+                # Voice config stays next to the fp32 model
+                try:
+                    self.piper_voice = PiperVoice.load(session_file, config_path=f"{model_file}.json")
+                except Exception as e:
+                    if session_file == model_file:
+                        raise
+                    # Bad int8 model - use fp32, and drop it so a later start re-quantizes
+                    logger.warning(f"⚠️ int8 Piper voice failed to load, using fp32: {e}")
+                    Path(session_file).unlink(missing_ok=True)
+                    session_file = model_file
+                    self.piper_voice = PiperVoice.load(session_file, config_path=f"{model_file}.json")
+                self._optimize_piper_session(session_file)
                 self.tts_engine = 'piper'  # Just a marker
                 logger.success(f"✅ Piper TTS initialized (voice: {self.tts_voice}, neural)")
                 return self.tts_engine
@@ -167,14 +344,109 @@ class VoiceHandler:
                 # Fall through to pyttsx3
 
         # Fallback to pyttsx3
+        if not PYTTSX3_AVAILABLE:
+            raise RuntimeError("No TTS engine available - install piper-tts or pyttsx3")
         logger.info("Initializing pyttsx3 TTS engine...")
-        import pyttsx3
         self.tts_engine = pyttsx3.init()
         self.tts_engine.setProperty('rate', int(150 * self.tts_speed))
         self.tts_engine.setProperty('volume', self.tts_volume)
         logger.success(f"✅ pyttsx3 TTS initialized (rate: {int(150 * self.tts_speed)} WPM)")
         return self.tts_engine
 
+    def _quantized_piper_model(self, model_file: str) -> str:
+        """
+        Get the int8 version of a Piper voice model, quantizing it on first use
+
+        Dynamic int8 weight quantization of the MatMul/Gemm layers (convs
+        stay fp32 - quantized they become ConvInteger nodes the CPU EP can't
+        run with int8 weights). The result is cached next to the fp32 model
+        (en_US-joe-medium.onnx → en_US-joe-medium.int8.onnx) once a test
+        session has loaded it.
+
+        Args:
+            model_file: Path to the fp32 Piper .onnx voice model
+
+        Returns:
+            Path to the int8 model, or model_file if quantization isn't possible
+        """
+        int8_file = str(Path(model_file).with_suffix('.int8.onnx'))
+        if Path(int8_file).exists():
+            return int8_file
+
+        try:
+            import onnxruntime
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+
+            logger.info(f"Quantizing Piper voice to int8 (one-time): {int8_file}")
+            start = time.time()
+            quantize_dynamic(model_file, int8_file, weight_type=QuantType.QUInt8,
+                             op_types_to_quantize=['MatMul', 'Gemm'])
+            # Only keep it if ONNX Runtime can actually run it
+            onnxruntime.InferenceSession(int8_file, providers=['CPUExecutionProvider'])
+            logger.success(f"✅ Piper voice quantized ({int((time.time() - start) * 1000)}ms)")
+            return int8_file
+        except Exception as e:
+            logger.warning(f"Piper int8 quantization unavailable, using fp32 voice: {e}")
+            Path(int8_file).unlink(missing_ok=True)  # Don't leave a partial/unloadable model behind
+            return model_file
+
+    def _optimize_piper_session(self, model_file: str):
+        """
+        Replace Piper's ONNX Runtime session with a fully optimized one
+
+        PiperVoice.load() builds its session with default SessionOptions;
+        rebuild it with all graph optimizations (constant folding, node
+        fusion), the CPU memory arena / memory pattern, and one intra-op
+        thread per core. With tts.ep: openvino (and the OpenVINO execution
+        provider installed) OpenVINO runs the graph, CPU EP covers the rest.
+        Keeps Piper's session if anything fails.
+
+        Optimization results are cached in tts_cache_dir: the CPU EP writes
+        the optimized graph once and later starts load it as-is; OpenVINO
+        keeps its compiled kernel blobs there.
+
+        Args:
+            model_file: Path to the Piper .onnx voice model
+        """
+        try:
+            import onnxruntime as ort
+
+            sess_opts = ort.SessionOptions()
+            sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            sess_opts.enable_cpu_mem_arena = True
+            sess_opts.enable_mem_pattern = True
+            sess_opts.intra_op_num_threads = os.cpu_count() or 1
+            self.tts_cache_dir.mkdir(parents=True, exist_ok=True)
+
+            providers = ["CPUExecutionProvider"]
+            if self.tts_ep == 'openvino':
+                if "OpenVINOExecutionProvider" in ort.get_available_providers():
+                    providers.insert(0, ("OpenVINOExecutionProvider", {
+                        "device_type": "CPU_FP32",
+                        "num_of_threads": os.cpu_count() or 1,
+                        "cache_dir": str(self.tts_cache_dir / 'ov_cache'),
+                    }))
+                else:
+                    logger.warning("OpenVINO execution provider not installed - using CPU EP")
+
+            session_file = model_file
+            if len(providers) == 1:
+                # CPU EP: reuse the optimized graph from an earlier start (OpenVINO
+                # compiles nodes, which can't be saved this way - it has cache_dir)
+                opt_file = self.tts_cache_dir / f"{Path(model_file).stem}.opt.onnx"
+                if opt_file.exists() and opt_file.stat().st_mtime >= Path(model_file).stat().st_mtime:
+                    session_file = str(opt_file)
+                    sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+                else:
+                    sess_opts.optimized_model_filepath = str(opt_file)
+
+            self.piper_voice.session = ort.InferenceSession(
+                session_file, sess_options=sess_opts, providers=providers)
+            logger.debug(f"Piper ONNX session rebuilt from {Path(session_file).name} "
+                         f"({self.piper_voice.session.get_providers()[0]})")
+        except Exception as e:
+            logger.warning(f"Keeping default Piper ONNX session: {e}")
+
     def record_audio(self, duration: float = 3.0, silence_threshold: float = 0.01) -> Optional[np.ndarray]:
         """
         Record audio from microphone (fixed duration - for backwards compatibility)
@@ -203,7 +475,7 @@ class VoiceHandler:
             sd.wait()  # Wait for recording to complete
 
             # Calculate RMS to check if audio was captured
-            rms = np.sqrt(np.mean(recording ** 2))
+            rms = _rms(recording)
             record_time = int((time.time() - start_time) * 1000)
 
             if rms < silence_threshold:
@@ -235,16 +507,14 @@ class VoiceHandler:
         try:
             self.stats['total_recordings'] += 1
 
-            # Initialize WebRTC VAD
-            vad = webrtcvad.Vad(vad_aggressiveness)
+            # WebRTC VAD (one instance, per-call aggressiveness)
+            vad = self._vad
+            vad.set_mode(vad_aggressiveness)
 
-            # VAD frame parameters (must be 10, 20, or 30ms)
-            frame_duration_ms = 30  # 30ms frames
-            frame_size = int(self.sample_rate * frame_duration_ms / 1000)  # samples per frame
-            bytes_per_frame = frame_size * 2  # 16-bit = 2 bytes per sample
+            frame_duration_ms = self._vad_frame_ms
+            frame_size = self._vad_frame_size
 
             # Recording state
-            audio_buffer = []
             silence_frames = 0
             silence_threshold_frames = int(silence_duration * 1000 / frame_duration_ms)
             speech_detected = False
@@ -252,20 +522,17 @@ class VoiceHandler:
             min_speech_frames = 10  # Require ~300ms of speech to avoid false triggers from noise
             max_frames = int(max_duration * 1000 / frame_duration_ms)
 
+            # Kept audio goes straight into one preallocated buffer (max length)
+            audio_buffer = np.empty(max_frames * frame_size, dtype=np.int16)
+            write_pos = 0
+
             logger.info(f"🎤 Recording with VAD (stops after {silence_duration}s silence, max {max_duration}s)...")
             logger.info(f"   VAD aggressiveness: {vad_aggressiveness} (0=liberal, 3=strict)")
             logger.info("   Speak now...")
             start_time = time.time()
 
-            # Start audio stream
-            stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype=np.int16,  # VAD requires 16-bit PCM
-                device=self.device_index,
-                blocksize=frame_size
-            )
-            stream.start()
+            # Start audio stream (or reuse the open one)
+            stream = self._get_input_stream(frame_size)
 
             frame_count = 0
             try:
@@ -276,8 +543,9 @@ class VoiceHandler:
                     if overflowed:
                         logger.warning("⚠️ Audio buffer overflow (processing too slow)")
 
-                    # Convert to bytes for VAD
-                    frame_bytes = frame_data.tobytes()
+                    # Byte view of the frame for VAD (no copy) - webrtcvad takes any
+                    # buffer, and len() of the 'B' cast is the byte count it expects
+                    frame_bytes = memoryview(frame_data).cast('B')
 
                     # Check if this frame contains speech
                     is_speech = vad.is_speech(frame_bytes, self.sample_rate)
@@ -293,13 +561,16 @@ class VoiceHandler:
 
                         # Always buffer if we've detected real speech
                         if speech_detected:
-                            audio_buffer.append(frame_data)
+                            audio_buffer[write_pos:write_pos + frame_size] = frame_data[:, 0]
+                            write_pos += frame_size
                     else:
                         # Silence detected
                         if speech_detected:
                             # Only count silence after we've detected sustained speech
                             silence_frames += 1
-                            audio_buffer.append(frame_data)  # Still collect during silence
+                            # Still collect during silence
+                            audio_buffer[write_pos:write_pos + frame_size] = frame_data[:, 0]
+                            write_pos += frame_size
 
                             # Stop if we've had enough silence
                             if silence_frames >= silence_threshold_frames:
@@ -314,29 +585,29 @@ class VoiceHandler:
                     frame_count += 1
 
             finally:
-                stream.stop()
-                stream.close()
+                if not self.keep_input_open:
+                    self._close_input_stream()
 
             # Check if we got any speech
             if not speech_detected:
                 logger.warning("⚠️ No speech detected")
                 return None
 
-            # Combine all frames into single numpy array
-            if not audio_buffer:
+            # Frames were written in place - just the filled part
+            if write_pos == 0:
                 logger.warning("⚠️ No audio collected")
                 return None
 
-            # Concatenate all frames
-            audio_int16 = np.concatenate(audio_buffer, axis=0).squeeze()
+            audio_int16 = audio_buffer[:write_pos]
 
-            # Convert to float32 (for compatibility with Whisper)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
+            # Convert to float32 (for compatibility with Whisper) - cast and
+            # scale in one pass
+            audio_float32 = np.multiply(audio_int16, np.float32(1.0 / 32768.0), dtype=np.float32)
 
             # Calculate stats
             record_time = int((time.time() - start_time) * 1000)
             duration_recorded = len(audio_float32) / self.sample_rate
-            rms = np.sqrt(np.mean(audio_float32 ** 2))
+            rms = _rms(audio_float32)
 
             logger.success(f"✅ Audio recorded ({record_time}ms, {duration_recorded:.1f}s, RMS: {rms:.4f})")
             return audio_float32
@@ -380,9 +651,21 @@ class VoiceHandler:
             start_time = time.time()
 
             # Whisper expects float32 audio
-            result = model.transcribe(audio, fp16=False)  # fp16=False for CPU
-
-            text = result['text'].strip()
+            if FASTER_WHISPER_AVAILABLE:
+                # Greedy decoding (beam_size=1) - close enough for short commands and
+                # much faster; Silero VAD trims silence before the encoder sees it.
+                # Segments are generated lazily - decoding happens in the join
+                segments, _ = model.transcribe(audio.astype(np.float32, copy=False),
+                                               language=self.whisper_language,
+                                               beam_size=1,
+                                               vad_filter=True,
+                                               vad_parameters={"min_silence_duration_ms": 300, "threshold": 0.5},
+                                               condition_on_previous_text=False,
+                                               no_speech_threshold=0.6)
+                text = " ".join(segment.text.strip() for segment in segments).strip()
+            else:
+                result = model.transcribe(audio, fp16=False, language=self.whisper_language)  # fp16=False for CPU
+                text = result['text'].strip()
             transcribe_time = int((time.time() - start_time) * 1000)
 
             if text:
@@ -426,66 +709,42 @@ class VoiceHandler:
 
         return shifted_audio
 
-    def _clean_text_for_tts(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _clean_text_for_tts(text: str) -> str:
         """
         Clean text for TTS by removing/replacing punctuation that sounds bad when read aloud
 
+        Cached - short replies ("Okay.", "Hello!") recur across a session
+
         Args:
             text: Original text
 
         Returns:
             Cleaned text suitable for TTS
         """
-        import re
-
         # Remove URLs (they sound terrible when read)
-        text = re.sub(r'http[s]?://\S+', '', text)
+        text = _TTS_URL_RE.sub('', text)
 
-        # Replace common punctuation with pauses
-        text = text.replace('...', '. ')  # Ellipsis to period
-        text = text.replace('…', '. ')    # Unicode ellipsis
-
-        # Remove quotes (TTS doesn't need to say "quote")
-        text = text.replace('"', '')
-        text = text.replace('"', '')
-        text = text.replace('"', '')
-        text = text.replace("'", '')
-        text = text.replace("'", '')
-        text = text.replace("'", '')
+        # Ellipsis to period, then every single-character fix in one pass
+        text = text.replace('...', '. ').translate(_TTS_TRANSLATE_TABLE)
 
         # Replace dashes with pauses
-        text = text.replace(' - ', ', ')
-        text = text.replace(' — ', ', ')
-        text = text.replace(' – ', ', ')
-
-        # Remove parentheses (keep content, remove parens)
-        text = text.replace('(', '')
-        text = text.replace(')', '')
-        text = text.replace('[', '')
-        text = text.replace(']', '')
-
-        # Remove asterisks (markdown emphasis)
-        text = text.replace('*', '')
-
-        # Remove underscores (markdown emphasis)
-        text = text.replace('_', ' ')
-
-        # Replace semicolons with commas (more natural pause)
-        text = text.replace(';', ',')
+        text = _TTS_DASH_RE.sub(', ', text)
 
         # Remove colons that aren't part of time (e.g., "Note: " becomes "Note. ")
-        text = re.sub(r':\s', '. ', text)
+        text = _TTS_COLON_RE.sub('. ', text)
 
         # Clean up multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _TTS_SPACE_RE.sub(' ', text)
 
-        # Clean up multiple punctuation
-        text = re.sub(r'\.{2,}', '.', text)  # Multiple periods to single
-        text = re.sub(r',{2,}', ',', text)   # Multiple commas to single
+        # Clean up multiple punctuation (periods / commas to single)
+        text = _TTS_REPEAT_RE.sub(r'\1', text)
 
         return text.strip()
 
-    def speak(self, text: str, emotion: Optional[str] = None) -> bool:
+    def speak(self, text: str, emotion: Optional[str] = None,
+              more_text: Optional[queue.Queue] = None) -> bool:
         """
         Speak text using TTS (Piper or pyttsx3) with mouth animation and emotion-based voice modulation
 
@@ -493,6 +752,9 @@ class VoiceHandler:
             text: Text to speak
             emotion: Emotion state for voice modulation (e.g., 'happy', 'sarcasm', 'frustrated')
                     If None, uses default voice parameters
+            more_text: Queue of further text for the same utterance, None-terminated
+                    (a streamed reply). Each piece is synthesized while the previous
+                    one plays, on one output stream with one 'speaking' expression
 
         Returns:
             True if successful, False otherwise
@@ -525,6 +787,13 @@ class VoiceHandler:
             logger.info(f"🔊 Speaking{emotion_label}: \"{cleaned_text[:50]}{'...' if len(cleaned_text) > 50 else ''}\"")
             start_time = time.time()
 
+            def next_text():
+                """Next queued text for this utterance (cleaned), None once it's done"""
+                if more_text is None:
+                    return None
+                queued = more_text.get()
+                return self._clean_text_for_tts(queued) if queued is not None else None
+
             # Save current expression and switch to 'speaking' for proper eye positioning
             previous_expression = None
             if self.expression_engine:
@@ -550,40 +819,67 @@ class VoiceHandler:
             try:
                 if self.tts_engine == 'piper' and self.piper_voice:
                     # Use Piper TTS
-                    audio_bytes = bytearray()
-                    for chunk in self.piper_voice.synthesize(cleaned_text):
-                        audio_bytes.extend(chunk.audio_int16_bytes)
-
-                    # Convert to float32 audio
-                    audio_array = np.frombuffer(bytes(audio_bytes), dtype=np.int16)
-                    audio_float = audio_array.astype(np.float32) / 32767.0
-
-                    # Apply emotion-based pitch shifting (v2.1)
                     original_sample_rate = self.piper_voice.config.sample_rate
-                    if pitch_shift != 0:
-                        logger.debug(f"Applying pitch shift: {pitch_shift:+d} semitones")
-                        audio_float = self._pitch_shift_audio(audio_float, pitch_shift, original_sample_rate)
 
                     # Calculate playback sample rate for speed modulation (v2.1)
                     # Higher sample rate = faster playback
                     playback_sample_rate = int(original_sample_rate * speed_multiplier)
                     logger.debug(f"Playback speed: {speed_multiplier:.2f}x ({original_sample_rate}Hz -> {playback_sample_rate}Hz)")
 
+                    # Playback volume (base volume * emotion volume multiplier) and
+                    # int16 → float scale, applied by the stream callback as it copies
+                    # each block out - no separately scaled copy of the audio
+                    gain = np.float32(self.tts_volume * volume_multiplier / 32767.0)
+
+                    # Piper synthesizes in a producer thread and its int16 chunks go to
+                    # the output stream as they're ready, so playback starts after the
+                    # first sentence rather than the whole utterance. None ends it
+                    audio_queue = queue.Queue()
+
+                    def synthesize_chunks():
+                        """Producer: Piper chunks → playback queue"""
+                        try:
+                            piece = cleaned_text
+                            while piece is not None:
+                                if pitch_shift != 0:
+                                    # Pitch shifting resamples each piece of text at once
+                                    chunks = [np.frombuffer(chunk.audio_int16_bytes, dtype=np.int16)
+                                              for chunk in self.piper_voice.synthesize(piece)]
+                                    if chunks:
+                                        logger.debug(f"Applying pitch shift: {pitch_shift:+d} semitones")
+                                        audio = self._pitch_shift_audio(np.concatenate(chunks), pitch_shift, original_sample_rate)
+                                        audio_queue.put(audio.astype(np.float32, copy=False))  # Still int16 scale
+                                else:
+                                    for chunk in self.piper_voice.synthesize(piece):
+                                        audio_queue.put(np.frombuffer(chunk.audio_int16_bytes, dtype=np.int16))
+                                # Queued text (streamed reply) joins this utterance - the
+                                # stream plays silence if it hasn't arrived yet
+                                piece = next_text()
+                        except Exception as e:
+                            logger.error(f"❌ Piper synthesis failed: {e}")
+                        finally:
+                            audio_queue.put(None)
+
+                    synth_thread = threading.Thread(target=synthesize_chunks, name="tts-synth", daemon=True)
+                    synth_thread.start()
+
+                    # Note: use playback_sample_rate for speed modulation
+                    blocksize = int(playback_sample_rate * 0.03)  # 30ms chunks (faster = more responsive lip sync)
+                    animate = bool(servo_controller and mouth_animation_params)
+
                     # Audio-reactive mouth movement: analyze amplitude in real-time
-                    if servo_controller and mouth_animation_params:
+                    if animate:
                         logger.info(f"🗣️ Starting AUDIO-REACTIVE mouth animation (sensitivity={mouth_animation_params['sensitivity']}, max_angle={mouth_animation_params['max_angle']})")
 
                         # Setup for audio-reactive animation
-                        # Note: use playback_sample_rate for speed modulation
-                        blocksize = int(playback_sample_rate * 0.03)  # 30ms chunks (faster = more responsive lip sync)
-                        neutral = servo_controller.mouth_config['neutral_angle']
-                        max_angle = mouth_animation_params['max_angle']
+                        # Whole degrees - mouth positions index the servo value table below
+                        neutral = int(servo_controller.mouth_config['neutral_angle'])
+                        max_angle = int(mouth_animation_params['max_angle'])
                         sensitivity = mouth_animation_params['sensitivity']
                         mouth_range = (max_angle - neutral) * sensitivity
 
-                        # Cancel pending detach timers
-                        if servo_controller._detach_timer:
-                            servo_controller._detach_timer.cancel()
+                        # Cancel pending idle detach
+                        servo_controller.cancel_detach()
 
                         # Attach all servos (mouth for animation, eyes for natural blinking)
                         servo_controller.mouth.value = servo_controller.angle_to_servo_value_mouth(neutral)
@@ -595,8 +891,22 @@ class VoiceHandler:
                         servo_controller.left_eyelid.value = servo_controller.angle_to_servo_value_left_eye(servo_controller.current_left)
                         servo_controller.right_eyelid.value = servo_controller.angle_to_servo_value_right_eye(servo_controller.current_right)
 
-                        # Smoothing state (mutable list so callback can modify)
-                        smoothed_amplitude = [0.0]  # Exponential moving average
+                        # Amplitude envelope: one-pole IIR over the squared samples (a
+                        # running mean square, per sample rather than per chunk). The
+                        # per-sample pole matches the old per-chunk EMA (alpha = 0.6:
+                        # 60% new chunk, 40% previous) so responsiveness is unchanged
+                        env_alpha = 1.0 - 0.4 ** (1.0 / blocksize)
+                        env_b = np.array([env_alpha])
+                        env_a = np.array([1.0, env_alpha - 1.0])
+                        env_zi = np.zeros(1)  # Filter state, carried between chunks
+
+                        # Servo values precomputed once per utterance - the callback only
+                        # indexes them. mouth_lut[i] is the value for neutral + i degrees
+                        mouth_servo = servo_controller.mouth
+                        mouth_lut = tuple(servo_controller.angle_to_servo_value_mouth(angle)
+                                          for angle in range(neutral, max(neutral, max_angle) + 1))
+                        left_closed = servo_controller.angle_to_servo_value_left_eye(0)
+                        right_closed = servo_controller.angle_to_servo_value_right_eye(0)
 
                         # Eye blinking state for natural animation during speech
                         frame_count = [0]
@@ -609,27 +919,15 @@ class VoiceHandler:
                             Real-time audio callback - moves mouth based on actual audio amplitude
                             With faster EMA smoothing and natural eye blinks
                             """
-                            # Calculate RMS amplitude of this audio chunk
-                            rms = np.sqrt(np.mean(outdata**2))
-
-                            # Apply non-linear scaling for more natural look
-                            scaled_amplitude = np.sqrt(rms) * sensitivity * 8.0  # 8.0x boost for more dramatic movement
-
-                            # Exponential moving average for smoothing (reduces jitter)
-                            # alpha = 0.6 means 60% new value, 40% previous (faster response, less lag)
-                            alpha = 0.6
-                            smoothed_amplitude[0] = alpha * scaled_amplitude + (1 - alpha) * smoothed_amplitude[0]
-
-                            # Clamp to 0-1
-                            smoothed = min(1.0, max(0.0, smoothed_amplitude[0]))
-
-                            # Calculate mouth position (no minimum threshold for maximum responsiveness)
-                            mouth_pos = neutral + int(mouth_range * smoothed)
-                            mouth_pos = max(neutral, min(max_angle, mouth_pos))
+                            # Smoothed RMS at the end of this chunk → mouth position
+                            samples = outdata[:, 0]
+                            envelope, env_zi[:] = signal.lfilter(env_b, env_a, samples * samples, zi=env_zi)
+                            mouth_pos = _update_mouth(math.sqrt(max(0.0, envelope[-1])), sensitivity,
+                                                      mouth_range, neutral, max_angle)
 
                             # Update mouth position (removed 1° threshold for faster response)
                             try:
-                                servo_controller.mouth.value = servo_controller.angle_to_servo_value_mouth(mouth_pos)
+                                mouth_servo.value = mouth_lut[mouth_pos - neutral]
                                 servo_controller.current_mouth = mouth_pos
                             except:
                                 pass  # Ignore errors in callback (don't crash audio playback)
@@ -643,8 +941,8 @@ class VoiceHandler:
                                 if random.random() < 0.1:  # 10% chance per check = natural variation
                                     try:
                                         # Quick blink both eyes
-                                        servo_controller.left_eyelid.value = servo_controller.angle_to_servo_value_left_eye(0)
-                                        servo_controller.right_eyelid.value = servo_controller.angle_to_servo_value_right_eye(0)
+                                        servo_controller.left_eyelid.value = left_closed
+                                        servo_controller.right_eyelid.value = right_closed
                                         last_blink_frame[0] = frame_count[0]
                                     except:
                                         pass
@@ -657,46 +955,55 @@ class VoiceHandler:
                                 except:
                                     pass
 
-                        # Play audio with real-time mouth animation using OutputStream
-                        # Apply volume modulation (base volume * emotion volume multiplier)
-                        audio_data = audio_float * self.tts_volume * volume_multiplier
-                        frame_index = [0]  # Mutable counter for callback
-
-                        def stream_callback(outdata, frames, time_info, status):
-                            """Stream callback that plays audio AND animates mouth"""
-                            start_idx = frame_index[0]
-                            end_idx = start_idx + frames
-
-                            if end_idx > len(audio_data):
-                                # End of audio - pad with zeros
-                                remaining = len(audio_data) - start_idx
-                                if remaining > 0:
-                                    outdata[:remaining, 0] = audio_data[start_idx:]
-                                    outdata[remaining:, 0] = 0
-                                else:
-                                    outdata[:, 0] = 0
-                                frame_index[0] = len(audio_data)
-                            else:
-                                # Normal playback
-                                outdata[:, 0] = audio_data[start_idx:end_idx]
-                                frame_index[0] = end_idx
-
-                            # Call audio-reactive mouth animation
+                    # Play audio as it arrives (with audio-reactive mouth animation)
+                    current = [np.zeros(0, dtype=np.float32)]  # Chunk being played
+                    position = [0]  # Frames of the current chunk already played
+                    ended = [False]  # End-of-utterance sentinel reached
+                    playback_done = threading.Event()  # Set once the stream has drained
+
+                    def stream_callback(outdata, frames, time_info, status):
+                        """Stream callback that plays queued audio AND animates mouth"""
+                        out = outdata[:, 0]
+                        filled = 0
+                        while filled < frames and not ended[0]:
+                            if position[0] >= len(current[0]):
+                                try:
+                                    next_chunk = audio_queue.get_nowait()
+                                except queue.Empty:
+                                    break  # Synthesis behind playback - pad with silence
+                                if next_chunk is None:
+                                    ended[0] = True  # End of utterance
+                                    break
+                                current[0] = next_chunk
+                                position[0] = 0
+                                continue
+                            n = min(frames - filled, len(current[0]) - position[0])
+                            # Scale (int16 → float, volume) straight into the output
+                            np.multiply(current[0][position[0]:position[0] + n], gain,
+                                        out=out[filled:filled + n])
+                            filled += n
+                            position[0] += n
+                        out[filled:] = 0
+
+                        # Call audio-reactive mouth animation
+                        if animate:
                             audio_callback(outdata, frames, time_info, status)
 
-                        # Play audio with mouth animation (using modulated sample rate for speed control)
-                        with sd.OutputStream(samplerate=playback_sample_rate, blocksize=blocksize,
-                                           channels=1, callback=stream_callback):
-                            # Wait for all audio to play
-                            while frame_index[0] < len(audio_data):
-                                sd.sleep(100)  # Sleep 100ms between checks
+                        if ended[0]:
+                            # This block still plays, then the stream finishes
+                            raise sd.CallbackStop
+
+                    # Play audio (using modulated sample rate for speed control).
+                    # finished_callback fires when the stream stops for any reason
+                    with sd.OutputStream(samplerate=playback_sample_rate, blocksize=blocksize,
+                                         channels=1, dtype='float32', callback=stream_callback,
+                                         finished_callback=playback_done.set):
+                        playback_done.wait()
+                    synth_thread.join()
 
+                    if animate:
                         # Return mouth to neutral after speech
                         servo_controller.set_mouth(neutral, smooth=True, duration=0.2)
-                    else:
-                        # No servo controller - just play audio with emotion modulation
-                        sd.play(audio_float * self.tts_volume * volume_multiplier, samplerate=playback_sample_rate)
-                        sd.wait()
                 else:
                     # Use pyttsx3
                     # Apply emotion modulation for pyttsx3 (speed and volume only, no pitch shift)
@@ -711,8 +1018,11 @@ class VoiceHandler:
                             max_angle_override=mouth_animation_params['max_angle']
                         )
 
-                    self.tts_engine.say(cleaned_text)
-                    self.tts_engine.runAndWait()
+                    piece = cleaned_text
+                    while piece is not None:
+                        self.tts_engine.say(piece)
+                        self.tts_engine.runAndWait()
+                        piece = next_text()
 
                     # Return mouth to neutral after pyttsx3 speech
                     if servo_controller:
@@ -734,6 +1044,130 @@ class VoiceHandler:
             self.stats['tts_failures'] += 1
             return False
 
+    @staticmethod
+    def _primary_emotion(emotion_data) -> str:
+        """
+        Voice emotion from Gary's 'emotion' field (string or list of emotions)
+
+        Args:
+            emotion_data: Emotion string, or list with the primary emotion first
+
+        Returns:
+            Emotion name ('idle' if unusable)
+        """
+        if isinstance(emotion_data, list) and len(emotion_data) > 0:
+            logger.debug(f"Multiple emotions received: {emotion_data}, using primary: {emotion_data[0]}")
+            return emotion_data[0]  # Use primary emotion
+        return emotion_data if isinstance(emotion_data, str) else 'idle'
+
+    def _start_speaker(self, text: str, emotion: Optional[str], more_text: queue.Queue) -> threading.Thread:
+        """
+        Speak a streamed reply in the background
+
+        Args:
+            text: First chunk of the reply
+            emotion: Voice emotion for the whole reply
+            more_text: Queue the rest of the reply is put on, None-terminated
+
+        Returns:
+            The started speaker thread (join to wait for the reply to finish)
+        """
+        speaker = threading.Thread(target=self.speak, args=(text, emotion),
+                                   kwargs={'more_text': more_text}, name="tts-stream", daemon=True)
+        speaker.start()
+        return speaker
+
+    def stream_reply(self, audio: np.ndarray, authorization: Optional[Dict] = None) -> Tuple[Optional[Dict], Optional[threading.Thread]]:
+        """
+        Send recorded audio to Gary and start speaking the reply as it streams in
+
+        Gary's final 'response' is the authoritative reply text (displayed,
+        returned, and the source of whatever hasn't been spoken yet). Streamed
+        deltas only let speech start early: they are raw LLM text, so *stage
+        direction* markers - which Gary strips from 'response' - are dropped
+        here too. Speech waits for an 'emotion' on a delta (the voice is
+        modulated for the whole reply); a Gary that sends none, or doesn't
+        stream, is spoken from the final response.
+
+        Args:
+            audio: Recorded audio (numpy array)
+            authorization: Authorization context for the LLM query
+
+        Returns:
+            (result, speaker) - Gary's result dict and the thread still speaking
+            it (join to wait for the reply to finish), or (None, None) if Gary
+            returned no response
+        """
+        speech_queue = queue.Queue()
+        speaker = None  # Started with the first chunk
+        pending = ''  # Streamed text not handed to the speaker yet
+        spoken = ''  # Streamed text handed to the speaker
+        current_emotion = None  # Voice emotion, once Gary has sent one
+        result = None
+
+        try:
+            for message in self.llm_manager.stream_audio_query(audio, self.sample_rate, authorization):
+                if 'delta' not in message:
+                    result = message
+                    break
+                if message.get('emotion') and current_emotion is None:
+                    current_emotion = self._primary_emotion(message['emotion'])
+                    logger.info(f"🎭 Gary streamed emotion: {current_emotion}")
+                pending = _SPEECH_MARKER_RE.sub('', pending + message['delta'])
+                if current_emotion is None:
+                    continue  # Hold speech until the voice emotion is known
+
+                # An unclosed *marker* stays pending until its closing asterisk
+                ready, star, held = pending.partition('*')
+                chunk, ready = _next_speech_chunk(ready, first=speaker is None)
+                while chunk:
+                    if speaker is None:
+                        speaker = self._start_speaker(chunk, current_emotion, speech_queue)
+                    else:
+                        speech_queue.put(chunk)
+                    spoken += ' ' + chunk
+                    chunk, ready = _next_speech_chunk(ready, first=False)
+                pending = ready + star + held
+
+            if not result or not result.get('response'):
+                logger.error("❌ Audio processing returned no response")
+                result = None
+                return None, None
+
+            response_text = result['response']
+            logger.success(f"✅ Got response from {result.get('tier', 'unknown')} tier "
+                           f"(model: {result.get('model', 'unknown')})")
+            logger.info(f"   Transcribed: \"{result.get('transcription', '')}\"")
+
+            if speaker is None:
+                # Nothing spoken yet - the whole final response
+                current_emotion = self._primary_emotion(result.get('emotion', 'idle'))
+                speaker = self._start_speaker(response_text, current_emotion, speech_queue)
+            else:
+                # The rest of the final response after what was already spoken
+                spoken = ' '.join(spoken.split())
+                final = ' '.join(response_text.split())
+                if final.startswith(spoken):
+                    remaining = final[len(spoken):].strip()
+                else:
+                    logger.warning("⚠️ Streamed text doesn't match Gary's final response - finishing from the stream")
+                    remaining = pending.partition('*')[0].strip()
+                if remaining:
+                    speech_queue.put(remaining)
+            return result, speaker
+
+        except Exception as e:
+            logger.error(f"❌ Audio processing failed: {e}")
+            result = None
+            return None, None
+
+        finally:
+            # End the reply; on failure wait out whatever was already spoken
+            if speaker:
+                speech_queue.put(None)
+                if result is None:
+                    speaker.join()
+
     def process_voice_query(self, use_vad: bool = True, duration: float = 3.0, authorization: Optional[Dict] = None, expression: str = 'listening') -> Optional[str]:
         """
         Complete voice interaction: record → process (transcribe + query) → speak
@@ -799,45 +1233,24 @@ class VoiceHandler:
             except:
                 pass
 
-        logger.info("🤖 Processing audio query via Gary (full pipeline)...")
-        try:
-            # NEW: Single call for transcription + LLM processing
-            result = self.llm_manager.process_audio_query(audio, self.sample_rate, authorization)
+        logger.info("🤖 Processing audio query via Gary (full pipeline, streamed)...")
 
-            if not result or not result.get('response'):
-                logger.error("❌ Audio processing returned no response")
-                if self.expression_engine:
-                    try:
-                        self.expression_engine.set_expression('confused')
-                    except:
-                        pass
-                return None
-
-            transcription = result.get('transcription', '')
-            response_text = result['response']
-            tier = result.get('tier', 'unknown')
-            model = result.get('model', 'unknown')
-
-            # Get emotion from Gary's response (v2.1) - handle list or string
-            emotion_data = result.get('emotion', 'idle')
-            if isinstance(emotion_data, list) and len(emotion_data) > 0:
-                current_emotion = emotion_data[0]  # Use primary emotion
-                logger.debug(f"Multiple emotions received: {emotion_data}, using primary: {current_emotion}")
-            else:
-                current_emotion = emotion_data if isinstance(emotion_data, str) else 'idle'
+        # NEW: Single call for transcription + LLM processing, spoken as it streams in
+        result, speaker = self.stream_reply(audio, authorization)
 
-            logger.success(f"✅ Got response from {tier} tier (model: {model})")
-            logger.info(f"   Transcribed: \"{transcription}\"")
-
-        except Exception as e:
-            logger.error(f"❌ Audio processing failed: {e}")
+        if result is None:
             if self.expression_engine:
                 try:
-                    self.expression_engine.set_expression('error')
+                    self.expression_engine.set_expression('confused')
                 except:
                     pass
             return None
 
+        transcription = result.get('transcription', '')
+        response_text = result['response']
+        tier = result.get('tier', 'unknown')
+        current_emotion = self._primary_emotion(result.get('emotion', 'idle'))
+
         # Calculate response time
         response_time = time.time() - start_time
 
@@ -859,8 +1272,10 @@ class VoiceHandler:
                 response_time=response_time
             )
 
-        # Step 3: Speak response with emotion-based voice modulation (v2.1)
-        # Set visual expression to match Gary's emotion
+        # Wait for the speaker to finish the reply
+        speaker.join()
+
+        # Leave the visual expression matching Gary's emotion
         if result.get('emotion') and self.expression_engine:
             try:
                 self.expression_engine.set_expression(result['emotion'])
@@ -868,10 +1283,6 @@ class VoiceHandler:
             except:
                 pass
 
-        # Speak with emotion-based voice modulation
-        # NOTE: Don't set to 'speaking' - let emotion expression show during speech
-        self.speak(response_text, emotion=current_emotion)
-
         # Update stats
         total_time = int((time.time() - start_time) * 1000)
         self.stats['total_processing_time_ms'] += total_time
@@ -932,6 +1343,53 @@ class VoiceHandler:
 
         return True
 
+    def _get_input_stream(self, frame_size: int) -> sd.InputStream:
+        """
+        Get a started 16-bit mono input stream for VAD recording
+
+        Reuses the open stream when keep_open is set, dropping any audio
+        that queued up since the last recording.
+
+        Args:
+            frame_size: Samples per VAD frame (stream blocksize)
+
+        Returns:
+            Running sd.InputStream
+        """
+        stream = self._input_stream
+        if stream is not None and stream.active and stream.blocksize == frame_size:
+            # Drain audio captured between recordings
+            available = stream.read_available
+            if available:
+                stream.read(available)
+            return stream
+
+        self._close_input_stream()
+        stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype=np.int16,  # VAD requires 16-bit PCM
+            device=self.device_index,
+            blocksize=frame_size
+        )
+        stream.start()
+        self._input_stream = stream
+        return stream
+
+    def _close_input_stream(self):
+        """Stop and close the VAD input stream (releases the microphone)"""
+        stream, self._input_stream = self._input_stream, None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                logger.debug(f"Input stream close failed: {e}")
+
+    def cleanup(self):
+        """Release audio devices held between calls"""
+        self._close_input_stream()
+
     def get_stats(self) -> Dict:
         """
         Get usage statistics
@@ -971,7 +1429,7 @@ if __name__ == '__main__':
     # Load config
     config_path = Path(__file__).parent.parent / 'config' / 'gairi_head.yaml'
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YamlLoader)
 
     # Initialize voice handler
     handler = VoiceHandler(config)